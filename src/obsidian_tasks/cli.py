@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
+from dataclasses import dataclass
 from datetime import date, timedelta
 from glob import glob
 from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable
 
 from obsidian_tasks import tasks as tasks_mod
 from obsidian_tasks.env import load_dotenv_if_present
@@ -19,7 +23,25 @@ ANSI_GREY = "\x1b[90m"
 ANSI_RESET = "\x1b[0m"
 
 
-_WIKILINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+# Checkbox token -> color. Both "[x]" and "[X]" are listed so lookups need no lower().
+_CHECKBOX_COLORS = {
+    "[ ]": ANSI_BLUE,
+    "[x]": ANSI_GREEN,
+    "[X]": ANSI_GREEN,
+    "[-]": ANSI_GREY,
+    "[>]": ANSI_GREY,
+}
+# Checkbox token -> ready-made colored token, so rendering is one lookup and one concat.
+_CHECKBOX_PREFIXES = {
+    token: f"{color}{token}{ANSI_RESET}" for token, color in _CHECKBOX_COLORS.items()
+}
+
+# Records per stdout write in the stdlib JSON path: few writes, bounded memory.
+_JSON_BATCH_RECORDS = 512
+
+_WIKILINK_RE = re.compile(r"\[\[[^\]\n]+\]\]")
+# Bound once: _strip_wikilinks runs for every displayed task.
+_WIKILINK_SUB = _WIKILINK_RE.sub
 
 
 def _task_date_prefix(task: tasks_mod.Task) -> str | None:
@@ -33,12 +55,12 @@ def _task_date_prefix(task: tasks_mod.Task) -> str | None:
     # From daily note filename
     d = tasks_mod.try_parse_ymd(Path(task.file).stem)
     if d is not None:
-        return f"{d:%Y-%m-%d}"
+        return d.isoformat()
 
     # From first [[yyyy-mm-dd]] backlink in the task text
     backlinked = tasks_mod.extract_first_backlink_ymd(task.raw)
     if backlinked is not None:
-        return f"{backlinked:%Y-%m-%d}"
+        return backlinked.isoformat()
 
     return None
 
@@ -67,6 +89,7 @@ def _maybe_prefix_date(
     text: str,
     show_date: bool,
     use_color: bool,
+    today: date | None = None,
 ) -> str:
     if not show_date:
         return text
@@ -76,11 +99,11 @@ def _maybe_prefix_date(
     if d is None:
         return text
 
-    prefix = f"{d:%Y-%m-%d}"
+    prefix = d.isoformat()
 
     # Keep output stable and friendly: date + space + task
     if use_color:
-        c = _date_color(d=d, today=date.today())
+        c = _date_color(d=d, today=today or tasks_mod.current_date())
         return f"{c}{prefix}{ANSI_RESET} {text}"
     return f"{prefix} {text}"
 
@@ -100,14 +123,15 @@ def _maybe_sort_tasks_by_date(
     if not show_date:
         return tasks
 
-    def key(t: tasks_mod.Task) -> tuple[int, str, str, int]:
-        prefix = _task_date_prefix(t)
-        # Bucket 0: dated, Bucket 1: undated
-        bucket = 0 if prefix else 1
-        # Note: prefix is yyyy-mm-dd so lexical order matches chronological.
-        return (bucket, prefix or "9999-12-31", str(t.file), t.line_no)
+    return sorted(tasks, key=_task_date_sort_key)
+
 
-    return sorted(tasks, key=key)
+def _task_date_sort_key(t: tasks_mod.Task) -> tuple[int, str, str, int]:
+    prefix = _task_date_prefix(t)
+    # Bucket 0: dated, Bucket 1: undated
+    bucket = 0 if prefix else 1
+    # Note: prefix is yyyy-mm-dd so lexical order matches chronological.
+    return (bucket, prefix or "9999-12-31", str(t.file), t.line_no)
 
 
 def _parse_statuses(raw: str | None) -> list[str] | None:
@@ -141,6 +165,30 @@ def _use_colors_from_env() -> bool:
     return _env_truthy("OT_USE_COLORS")
 
 
+@dataclass(frozen=True)
+class _EnvConfig:
+    """Environment settings, read once per CLI invocation (after .env loading)."""
+
+    vault_root: str | None
+    calendar_dir: str | None
+    inbox_note: str
+    inbox_path: str | None
+    default_add_note: str | None
+    use_colors: bool
+
+    @classmethod
+    def from_environ(cls) -> _EnvConfig:
+        env = os.environ
+        return cls(
+            vault_root=env.get("OT_VAULT_PATH"),
+            calendar_dir=env.get("OT_CALENDAR_DIR"),
+            inbox_note=env.get("OT_INBOX_NOTE", "Inbox"),
+            inbox_path=env.get("OT_INBOX_PATH"),
+            default_add_note=env.get("OT_DEFAULT_ADD_NOTE"),
+            use_colors=_use_colors_from_env(),
+        )
+
+
 def _use_colors(args: argparse.Namespace) -> bool:
     """Decide whether to emit ANSI colors.
 
@@ -149,7 +197,7 @@ def _use_colors(args: argparse.Namespace) -> bool:
     - environment variable: OT_USE_COLORS
     """
 
-    return bool(getattr(args, "color", False)) or _use_colors_from_env()
+    return bool(getattr(args, "color", False)) or args.env.use_colors
 
 
 def _strip_wikilinks(text: str) -> str:
@@ -158,9 +206,23 @@ def _strip_wikilinks(text: str) -> str:
     Example: "Do thing for [[2026-01-17]]" -> "Do thing for"
     """
 
-    # Remove the whole wikilink token, then normalize whitespace.
-    without = _WIKILINK_RE.sub("", text)
-    return " ".join(without.split())
+    # Remove the whole wikilink token, then normalize whitespace. Most task lines
+    # have no wikilink at all, so skip the regex engine for those.
+    if "[[" in text:
+        text = _WIKILINK_SUB("", text)
+    return " ".join(text.split())
+
+
+def _display_text_plain(task: tasks_mod.Task) -> str:
+    """Task text without anything before the first '[' (e.g. '- ' or '* ')."""
+
+    return task.display
+
+
+def _display_text_stripped(task: tasks_mod.Task) -> str:
+    """Like `_display_text_plain`, but also removes wikilinks."""
+
+    return _strip_wikilinks(task.display)
 
 
 def colorize_checkbox_prefix(text: str) -> str:
@@ -170,30 +232,169 @@ def colorize_checkbox_prefix(text: str) -> str:
     If the format doesn't match, returns the string unchanged.
     """
 
-    if len(text) < 3 or text[0] != "[" or text[2] != "]":
+    prefix = _CHECKBOX_PREFIXES.get(text[:3])
+    if prefix is None:
         return text
+    return prefix + text[3:]
+
+
+def _render(tasks: list[tasks_mod.Task], args: argparse.Namespace, *, strip_wikilinks: bool) -> int:
+    """Print filtered tasks as JSON or human output, shared by all list commands."""
+
+    display_text = _display_text_stripped if strip_wikilinks else _display_text_plain
+
+    if args.json:
+        _emit_json_stream(tasks, display_text)
+        return 0
 
-    token = text[:3]
-    rest = text[3:]
+    if not tasks:
+        return 0
 
-    if token == "[ ]":
-        return f"{ANSI_BLUE}{token}{ANSI_RESET}{rest}"
-    if token.lower() == "[x]":
-        return f"{ANSI_GREEN}{token}{ANSI_RESET}{rest}"
-    if token == "[-]":
-        return f"{ANSI_GREY}{token}{ANSI_RESET}{rest}"
-    if token == "[>]":
-        return f"{ANSI_GREY}{token}{ANSI_RESET}{rest}"
+    use_color = _use_colors(args)
+    show_date = bool(getattr(args, "show_date", False))
+    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
+
+    # Human output: one task per line, written in a single call.
+    lines = _render_lines(tasks, display_text, use_color=use_color, show_date=show_date)
+    _write_stdout("\n".join(lines) + "\n")
 
-    return text
+    return 0
 
 
-def resolve_inbox_path() -> Path:
-    """Resolve inbox path from env (.env)."""
+def _write_stdout(text: str) -> None:
+    """Write a block of text to stdout, encoding it in one go.
 
-    vault = os.environ["OT_VAULT_PATH"]
-    inbox_note = os.environ.get("OT_INBOX_NOTE", "Inbox")
-    return Path(vault).expanduser() / inbox_note
+    When stdout exposes its binary buffer, the text is encoded once (with the
+    stream's own encoding) and written there directly. Streams without a buffer,
+    and platforms where text mode translates newlines, use a plain write.
+    """
+
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None or os.linesep != "\n":
+        out.write(text)
+        return
+    # Keep ordering with anything already written through the text layer.
+    out.flush()
+    buffer.write(text.encode(out.encoding or "utf-8", out.errors or "strict"))
+
+
+def _render_lines(
+    tasks: list[tasks_mod.Task],
+    display_text: Callable[[tasks_mod.Task], str],
+    *,
+    use_color: bool,
+    show_date: bool,
+) -> list[str]:
+    """Render tasks into human output lines.
+
+    The color and date decisions are made once up front rather than per task.
+    """
+
+    if use_color:
+        lines = [colorize_checkbox_prefix(display_text(t)) for t in tasks]
+    else:
+        lines = [display_text(t) for t in tasks]
+
+    if not show_date:
+        return lines
+    today = tasks_mod.current_date()
+    return [
+        _maybe_prefix_date(task=t, text=text, show_date=True, use_color=use_color, today=today)
+        for t, text in zip(tasks, lines)
+    ]
+
+
+def _emit_json_stream(
+    tasks: Iterable[tasks_mod.Task], display_text: Callable[[tasks_mod.Task], str]
+) -> None:
+    """Write tasks to stdout as a JSON array, a batch of records at a time.
+
+    The output is identical to `json.dumps(payload, ensure_ascii=False, indent=2)`,
+    but the full payload list is never materialized.
+    """
+
+    # JSON modules are only imported when --json is used.
+    try:  # Optional: a faster JSON serializer.
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        _emit_json_orjson(orjson, tasks, display_text)
+        return
+
+    import json
+
+    # One shared encoder for the string values; json.dumps(..., ensure_ascii=False)
+    # would build a new JSONEncoder on every call.
+    json_str = json.JSONEncoder(ensure_ascii=False).encode
+    parts: list[str] = []
+    sep = "[\n"
+    for t in tasks:
+        # Format the fixed three-key record directly; only the strings need the encoder.
+        parts.append(
+            f"{sep}  {{\n"
+            f'    "file": {json_str(str(t.file))},\n'
+            f'    "line_number": {t.line_no},\n'
+            f'    "text": {json_str(display_text(t))}\n'
+            "  }"
+        )
+        sep = ",\n"
+        if len(parts) >= _JSON_BATCH_RECORDS:
+            _write_stdout("".join(parts))
+            parts.clear()
+    parts.append("[]\n" if sep == "[\n" else "\n]\n")
+    _write_stdout("".join(parts))
+
+
+def _emit_json_orjson(
+    orjson: ModuleType,
+    tasks: Iterable[tasks_mod.Task],
+    display_text: Callable[[tasks_mod.Task], str],
+) -> None:
+    """Write tasks to stdout as a JSON array using orjson, a batch at a time.
+
+    orjson's OPT_INDENT_2 layout matches `json.dumps(..., indent=2)`; each batch
+    is dumped as a list and its brackets trimmed so the batches join into one
+    array. The UTF-8 bytes go straight to the binary buffer when stdout is UTF-8
+    encoded.
+    """
+
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    encoding = (out.encoding or "utf-8").lower().replace("_", "-")
+    if buffer is None or os.linesep != "\n" or encoding not in ("utf-8", "utf8"):
+
+        def write(data: bytes) -> None:
+            out.write(data.decode("utf-8"))
+
+    else:
+        out.flush()
+        write = buffer.write
+
+    dumps = orjson.dumps
+    option = orjson.OPT_INDENT_2
+    batch: list[dict[str, object]] = []
+    sep = b"[\n"
+    for t in tasks:
+        batch.append({"file": str(t.file), "line_number": t.line_no, "text": display_text(t)})
+        if len(batch) >= _JSON_BATCH_RECORDS:
+            # Drop the batch's own "[\n" and "\n]".
+            write(sep + dumps(batch, option=option)[2:-2])
+            sep = b",\n"
+            batch.clear()
+    if batch:
+        write(sep + dumps(batch, option=option)[2:-2])
+        sep = b",\n"
+    write(b"[]\n" if sep == b"[\n" else b"\n]\n")
+
+
+def resolve_inbox_path(*, vault_root: str | None = None, inbox_note: str | None = None) -> Path:
+    """Resolve inbox path from env (.env), unless given explicitly."""
+
+    vault = vault_root or os.environ["OT_VAULT_PATH"]
+    note = inbox_note or os.environ.get("OT_INBOX_NOTE", "Inbox")
+    return Path(vault).expanduser() / note
 
 
 def _resolve_paths(*, base_dir: Path, raw_paths: list[str] | None) -> list[Path]:
@@ -235,58 +436,24 @@ def _resolve_paths(*, base_dir: Path, raw_paths: list[str] | None) -> list[Path]
 
 
 def _cmd_inbox(args: argparse.Namespace) -> int:
-    root = Path(args.path).expanduser()
+    # Resolved here rather than as an argparse default, so other commands don't
+    # need OT_VAULT_PATH just to build the parser.
+    env = args.env
+    raw_path = (
+        args.path
+        or env.inbox_path
+        or resolve_inbox_path(vault_root=env.vault_root, inbox_note=env.inbox_note)
+    )
+    root = Path(raw_path).expanduser()
 
     tasks = tasks_mod.extract_tasks(root)
-    tasks = tasks_mod.filter_tasks_by_statuses(
-        tasks, statuses=_parse_statuses(getattr(args, "status", None))
-    )
-    tasks = tasks_mod.filter_tasks_by_priority(
-        tasks, priority_only=bool(getattr(args, "priority_only", False))
+    tasks = tasks_mod.filter_tasks(
+        tasks,
+        statuses=_parse_statuses(getattr(args, "status", None)),
+        priority_only=bool(getattr(args, "priority_only", False)),
     )
 
-    def display_text(raw: str) -> str:
-        # Omit everything before the first '[' (e.g. '- ' or '* '), keep the checkbox.
-        s = raw.lstrip()
-        i = s.find("[")
-        return s[i:].strip() if i != -1 else s.strip()
-
-    if args.json:
-        import json
-
-        payload = [
-            {
-                "file": str(t.file),
-                "line_number": t.line_no,
-                "text": display_text(t.raw),
-            }
-            for t in tasks
-        ]
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        return 0
-
-    if not tasks:
-        return 0
-
-    use_color = _use_colors(args)
-
-    show_date = bool(getattr(args, "show_date", False))
-    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
-
-    # Human output: one task per line
-    for t in tasks:
-        text = display_text(t.raw)
-        if use_color:
-            text = colorize_checkbox_prefix(text)
-        text = _maybe_prefix_date(
-            task=t,
-            text=text,
-            show_date=show_date,
-            use_color=use_color,
-        )
-        sys.stdout.write(f"{text}\n")
-
-    return 0
+    return _render(tasks, args, strip_wikilinks=False)
 
 
 def _cmd_today(args: argparse.Namespace) -> int:
@@ -301,20 +468,22 @@ def _cmd_day_offset(args: argparse.Namespace, *, offset_days: int) -> int:
     - tasks across the vault that backlink to that note via [[yyyy-mm-dd]]
     """
 
-    vault_root = os.environ.get("OT_VAULT_PATH")
-    calendar_dir = os.environ.get("OT_CALENDAR_DIR")
+    vault_root = args.env.vault_root
+    calendar_dir = args.env.calendar_dir
 
-    target = date.today() + timedelta(days=offset_days)
+    target = tasks_mod.current_date() + timedelta(days=offset_days)
 
     note_path = tasks_mod.resolve_calendar_daily_note_path(
         vault_path=vault_root, calendar_dir=calendar_dir, for_date=target
     )
 
-    tasks = tasks_mod.extract_tasks_from_today_note(
-        vault_path=vault_root, calendar_dir=calendar_dir, for_date=target
-    )
+    sources: list[list[tasks_mod.Task]] = [
+        tasks_mod.extract_tasks_from_today_note(
+            vault_path=vault_root, calendar_dir=calendar_dir, for_date=target
+        )
+    ]
     if vault_root:
-        tasks.extend(
+        sources.append(
             tasks_mod.extract_backlinked_tasks(
                 vault_root=vault_root,
                 note_path=note_path,
@@ -322,65 +491,24 @@ def _cmd_day_offset(args: argparse.Namespace, *, offset_days: int) -> int:
             )
         )
 
-    # Deduplicate in case the same task line gets included twice.
-    seen: set[tuple[str, int]] = set()
-    deduped: list[tasks_mod.Task] = []
-    for t in tasks:
-        key = (str(t.file), t.line_no)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(t)
-    tasks = deduped
+    # Deduplicate while collecting, in case the same task line gets included twice.
+    seen: set[tuple[Path, int]] = set()
+    tasks: list[tasks_mod.Task] = []
+    for src in sources:
+        for t in src:
+            key = (t.file, t.line_no)
+            if key in seen:
+                continue
+            seen.add(key)
+            tasks.append(t)
 
-    tasks = tasks_mod.filter_tasks_by_statuses(
-        tasks, statuses=_parse_statuses(getattr(args, "status", None))
+    tasks = tasks_mod.filter_tasks(
+        tasks,
+        statuses=_parse_statuses(getattr(args, "status", None)),
+        priority_only=bool(getattr(args, "priority_only", False)),
     )
-    tasks = tasks_mod.filter_tasks_by_priority(
-        tasks, priority_only=bool(getattr(args, "priority_only", False))
-    )
-
-    def display_text(raw: str) -> str:
-        # Omit everything before the first '[' (e.g. '- ' or '* '), keep the checkbox.
-        s = raw.lstrip()
-        i = s.find("[")
-        shown = s[i:].strip() if i != -1 else s.strip()
-        return _strip_wikilinks(shown)
 
-    if args.json:
-        import json
-
-        payload = [
-            {
-                "file": str(t.file),
-                "line_number": t.line_no,
-                "text": display_text(t.raw),
-            }
-            for t in tasks
-        ]
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        return 0
-
-    if not tasks:
-        return 0
-
-    use_color = _use_colors(args)
-    show_date = bool(getattr(args, "show_date", False))
-    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
-
-    for t in tasks:
-        text = display_text(t.raw)
-        if use_color:
-            text = colorize_checkbox_prefix(text)
-        text = _maybe_prefix_date(
-            task=t,
-            text=text,
-            show_date=show_date,
-            use_color=use_color,
-        )
-        sys.stdout.write(f"{text}\n")
-
-    return 0
+    return _render(tasks, args, strip_wikilinks=True)
 
 
 def _cmd_yesterday(args: argparse.Namespace) -> int:
@@ -394,7 +522,7 @@ def _cmd_tomorrow(args: argparse.Namespace) -> int:
 def _cmd_all(args: argparse.Namespace) -> int:
     """List all Markdown tasks across the vault."""
 
-    vault_root = os.environ.get("OT_VAULT_PATH")
+    vault_root = args.env.vault_root
     if not vault_root:
         raise KeyError(
             "OT_VAULT_PATH is required for the 'all' command (set it in your environment or .env)"
@@ -408,57 +536,16 @@ def _cmd_all(args: argparse.Namespace) -> int:
             tasks.extend(tasks_mod.extract_tasks(Path(p).expanduser()))
     else:
         tasks = tasks_mod.extract_tasks(vault_path)
-    tasks = tasks_mod.filter_tasks_by_statuses(
-        tasks, statuses=_parse_statuses(getattr(args, "status", None))
-    )
-    tasks = tasks_mod.filter_tasks_by_priority(
-        tasks, priority_only=bool(getattr(args, "priority_only", False))
+    tasks = tasks_mod.filter_tasks(
+        tasks,
+        statuses=_parse_statuses(getattr(args, "status", None)),
+        priority_only=bool(getattr(args, "priority_only", False)),
     )
     tasks = tasks_mod.filter_tasks_unscheduled(
         tasks, unscheduled_only=bool(getattr(args, "unscheduled", False))
     )
 
-    def display_text(raw: str) -> str:
-        # Omit everything before the first '[' (e.g. '- ' or '* '), keep the checkbox.
-        s = raw.lstrip()
-        i = s.find("[")
-        shown = s[i:].strip() if i != -1 else s.strip()
-        return _strip_wikilinks(shown)
-
-    if args.json:
-        import json
-
-        payload = [
-            {
-                "file": str(t.file),
-                "line_number": t.line_no,
-                "text": display_text(t.raw),
-            }
-            for t in tasks
-        ]
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        return 0
-
-    if not tasks:
-        return 0
-
-    use_color = _use_colors(args)
-    show_date = bool(getattr(args, "show_date", False))
-    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
-
-    for t in tasks:
-        text = display_text(t.raw)
-        if use_color:
-            text = colorize_checkbox_prefix(text)
-        text = _maybe_prefix_date(
-            task=t,
-            text=text,
-            show_date=show_date,
-            use_color=use_color,
-        )
-        sys.stdout.write(f"{text}\n")
-
-    return 0
+    return _render(tasks, args, strip_wikilinks=True)
 
 
 def _cmd_overdue(args: argparse.Namespace) -> int:
@@ -469,79 +556,43 @@ def _cmd_overdue(args: argparse.Namespace) -> int:
     - tasks anywhere in the vault that contain a backlink [[yyyy-mm-dd]] to a past date
     """
 
-    vault_root = os.environ.get("OT_VAULT_PATH")
+    vault_root = args.env.vault_root
     if not vault_root:
         raise KeyError(
             "OT_VAULT_PATH is required for the 'overdue' command "
             "(set it in your environment or .env)"
         )
 
-    calendar_dir = os.environ.get("OT_CALENDAR_DIR")
+    calendar_dir = args.env.calendar_dir
 
     tasks = tasks_mod.extract_overdue_tasks(
         vault_root=vault_root,
         calendar_dir=calendar_dir,
-        today=date.today(),
+        today=tasks_mod.current_date(),
     )
 
     # Overdue is primarily meant for actionable items: default to open tasks.
     raw_statuses = getattr(args, "status", None)
     statuses = _parse_statuses(raw_statuses) if raw_statuses is not None else ["open"]
-    tasks = tasks_mod.filter_tasks_by_statuses(
-        tasks, statuses=statuses
-    )
-    tasks = tasks_mod.filter_tasks_by_priority(
-        tasks, priority_only=bool(getattr(args, "priority_only", False))
+    tasks = tasks_mod.filter_tasks(
+        tasks,
+        statuses=statuses,
+        priority_only=bool(getattr(args, "priority_only", False)),
     )
 
-    # Keep output stable-ish: sort by file path then line.
-    tasks = sorted(tasks, key=lambda t: (str(t.file), t.line_no))
+    # Keep output stable-ish: sort by file path then line. Decorate once instead of
+    # calling a key lambda per task; the index keeps ties from comparing Tasks.
+    decorated = [(str(t.file), t.line_no, i, t) for i, t in enumerate(tasks)]
+    decorated.sort()
+    tasks = [t for *_, t in decorated]
 
-    def display_text(raw: str) -> str:
-        s = raw.lstrip()
-        i = s.find("[")
-        shown = s[i:].strip() if i != -1 else s.strip()
-        return _strip_wikilinks(shown)
-
-    if args.json:
-        import json
-
-        payload = [
-            {
-                "file": str(t.file),
-                "line_number": t.line_no,
-                "text": display_text(t.raw),
-            }
-            for t in tasks
-        ]
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        return 0
-
-    if not tasks:
-        return 0
-
-    use_color = _use_colors(args)
-    show_date = bool(getattr(args, "show_date", False))
-    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
-    for t in tasks:
-        text = display_text(t.raw)
-        if use_color:
-            text = colorize_checkbox_prefix(text)
-        text = _maybe_prefix_date(
-            task=t,
-            text=text,
-            show_date=show_date,
-            use_color=use_color,
-        )
-        sys.stdout.write(f"{text}\n")
-
-    return 0
+    return _render(tasks, args, strip_wikilinks=True)
 
 
 def _cmd_note(args: argparse.Namespace) -> int:
     """List tasks contained in a specific note looked up by filename stem."""
 
-    vault_root = os.environ.get("OT_VAULT_PATH")
+    vault_root = args.env.vault_root
     if not vault_root:
         raise KeyError(
             "OT_VAULT_PATH is required for the 'note' command (set it in your environment or .env)"
@@ -561,58 +612,19 @@ def _cmd_note(args: argparse.Namespace) -> int:
     for p in matches:
         tasks.extend(tasks_mod.extract_tasks_from_file(p))
 
-    tasks = tasks_mod.filter_tasks_by_statuses(
-        tasks, statuses=_parse_statuses(getattr(args, "status", None))
-    )
-    tasks = tasks_mod.filter_tasks_by_priority(
-        tasks, priority_only=bool(getattr(args, "priority_only", False))
+    tasks = tasks_mod.filter_tasks(
+        tasks,
+        statuses=_parse_statuses(getattr(args, "status", None)),
+        priority_only=bool(getattr(args, "priority_only", False)),
     )
 
-    def display_text(raw: str) -> str:
-        s = raw.lstrip()
-        i = s.find("[")
-        shown = s[i:].strip() if i != -1 else s.strip()
-        return _strip_wikilinks(shown)
-
-    if args.json:
-        import json
-
-        payload = [
-            {
-                "file": str(t.file),
-                "line_number": t.line_no,
-                "text": display_text(t.raw),
-            }
-            for t in tasks
-        ]
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        return 0
-
-    if not tasks:
-        return 0
-
-    use_color = _use_colors(args)
-    show_date = bool(getattr(args, "show_date", False))
-    tasks = _maybe_sort_tasks_by_date(tasks=tasks, show_date=show_date)
-    for t in tasks:
-        text = display_text(t.raw)
-        if use_color:
-            text = colorize_checkbox_prefix(text)
-        text = _maybe_prefix_date(
-            task=t,
-            text=text,
-            show_date=show_date,
-            use_color=use_color,
-        )
-        sys.stdout.write(f"{text}\n")
-
-    return 0
+    return _render(tasks, args, strip_wikilinks=True)
 
 
 def _cmd_add(args: argparse.Namespace) -> int:
     """Append a task to a chosen note."""
 
-    vault_root = os.environ.get("OT_VAULT_PATH")
+    vault_root = args.env.vault_root
     if not vault_root:
         raise KeyError(
             "OT_VAULT_PATH is required for the 'add' command (set it in your environment or .env)"
@@ -623,7 +635,7 @@ def _cmd_add(args: argparse.Namespace) -> int:
         sys.stderr.write("task text is required\n")
         return 2
 
-    note_name = getattr(args, "note", None) or os.environ.get("OT_DEFAULT_ADD_NOTE")
+    note_name = getattr(args, "note", None) or args.env.default_add_note
     note_name = str(note_name or "").strip()
     if not note_name:
         sys.stderr.write(
@@ -646,140 +658,59 @@ def _cmd_add(args: argparse.Namespace) -> int:
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    # During test runs, avoid pulling local developer defaults from a repo .env.
-    # Tests should control env vars explicitly via monkeypatch.
-    if os.environ.get("OT_DISABLE_DOTENV") not in {"1", "true", "yes", "on"}:
-        load_dotenv_if_present()
-    parser = argparse.ArgumentParser(prog="ot", description="Obsidian tasks CLI")
-    sub = parser.add_subparsers(dest="command", required=True)
+_SHOW_DATE_HELP = (
+    "Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)"
+)
+_STATUS_HELP = (
+    'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
+    '"scheduled" (- [>]). '
+    'You can pass multiple, comma-separated (e.g. "done,cancelled").'
+)
+_PRIORITY_ONLY_HELP = (
+    'Only include tasks with a " ! " immediately after the checkbox token '
+    '(e.g. "- [ ] ! foo")'
+)
+
+
+def _add_list_args(p: argparse.ArgumentParser) -> None:
+    """Add the output/filter flags shared by every task-listing command."""
 
-    inbox = sub.add_parser("inbox", help="List Markdown tasks in the inbox folder")
-    inbox.add_argument(
+    p.add_argument("--json", action="store_true", help="Output JSON")
+    p.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
+    p.add_argument("--show-date", action="store_true", help=_SHOW_DATE_HELP)
+    p.add_argument("--status", help=_STATUS_HELP)
+    p.add_argument("--priority-only", action="store_true", help=_PRIORITY_ONLY_HELP)
+
+
+def _add_inbox_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--path",
-        default=os.environ.get("OT_INBOX_PATH", str(resolve_inbox_path())),
+        default=None,
         help=(
-            "Inbox folder/file (default: OT_INBOX_PATH env var, or OT_VAULT_PATH/OT_INBOX_NOTE, "
-            "or built-in path)"
+            "Inbox folder/file (default: OT_INBOX_PATH env var, or OT_VAULT_PATH/OT_INBOX_NOTE)"
         ),
     )
-    inbox.add_argument("--json", action="store_true", help="Output JSON")
-    inbox.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    inbox.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    inbox.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    inbox.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    inbox.set_defaults(func=_cmd_inbox)
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_inbox)
 
-    today = sub.add_parser(
-        "today",
-        help="List Markdown tasks in today's daily note (Calendar folder, yyyy-mm-dd.md)",
-    )
-    today.add_argument("--json", action="store_true", help="Output JSON")
-    today.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    today.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    today.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    today.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    today.set_defaults(func=_cmd_today)
 
-    yesterday = sub.add_parser(
-        "yesterday",
-        help="List Markdown tasks in yesterday's daily note (Calendar folder, yyyy-mm-dd.md)",
-    )
-    yesterday.add_argument("--json", action="store_true", help="Output JSON")
-    yesterday.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    yesterday.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    yesterday.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    yesterday.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    yesterday.set_defaults(func=_cmd_yesterday)
+def _add_today_args(p: argparse.ArgumentParser) -> None:
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_today)
 
-    tomorrow = sub.add_parser(
-        "tomorrow",
-        help="List Markdown tasks in tomorrow's daily note (Calendar folder, yyyy-mm-dd.md)",
-    )
-    tomorrow.add_argument("--json", action="store_true", help="Output JSON")
-    tomorrow.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    tomorrow.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    tomorrow.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    tomorrow.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    tomorrow.set_defaults(func=_cmd_tomorrow)
 
-    all_cmd = sub.add_parser(
-        "all",
-        help="List Markdown tasks across the whole vault (all notes)",
-    )
-    all_cmd.add_argument(
+def _add_yesterday_args(p: argparse.ArgumentParser) -> None:
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_yesterday)
+
+
+def _add_tomorrow_args(p: argparse.ArgumentParser) -> None:
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_tomorrow)
+
+
+def _add_all_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--path",
         action="append",
         help=(
@@ -787,30 +718,8 @@ def build_parser() -> argparse.ArgumentParser:
             "Can be passed multiple times. Supports * wildcards (and ** for recursive)."
         ),
     )
-    all_cmd.add_argument("--json", action="store_true", help="Output JSON")
-    all_cmd.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    all_cmd.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    all_cmd.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    all_cmd.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    all_cmd.add_argument(
+    _add_list_args(p)
+    p.add_argument(
         "--unscheduled",
         action="store_true",
         help=(
@@ -818,84 +727,29 @@ def build_parser() -> argparse.ArgumentParser:
             "and do not contain a calendar backlink like [[2025-01-01]]"
         ),
     )
-    all_cmd.set_defaults(func=_cmd_all)
+    p.set_defaults(func=_cmd_all)
 
-    overdue = sub.add_parser(
-        "overdue",
-        help=(
-            "List overdue tasks: tasks in any past daily note and tasks with a "
-            "[[yyyy-mm-dd]] backlink to a past date"
-        ),
-    )
-    overdue.add_argument("--json", action="store_true", help="Output JSON")
-    overdue.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    overdue.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    overdue.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    overdue.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    overdue.set_defaults(func=_cmd_overdue)
 
-    note = sub.add_parser(
-        "note",
-        help=(
-            "List Markdown tasks in a note by name (searches vault for <name>.md and prints tasks)"
-        ),
-    )
-    note.add_argument(
+def _add_overdue_args(p: argparse.ArgumentParser) -> None:
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_overdue)
+
+
+def _add_note_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "name",
         help="Note name (filename without .md extension).",
     )
-    note.add_argument("--json", action="store_true", help="Output JSON")
-    note.add_argument("--color", "-c", action="store_true", help="Colorize checkbox")
-    note.add_argument(
-        "--show-date",
-        action="store_true",
-        help="Prefix each task with its date (daily note date or first [[yyyy-mm-dd]] backlink)",
-    )
-    note.add_argument(
-        "--status",
-        help=(
-            'Filter tasks by status: "open" (- [ ]), "done" (- [x]), "cancelled" (- [-]), '
-            '"scheduled" (- [>]). '
-            'You can pass multiple, comma-separated (e.g. "done,cancelled").'
-        ),
-    )
-    note.add_argument(
-        "--priority-only",
-        action="store_true",
-        help=(
-            'Only include tasks with a " ! " immediately after the checkbox token '
-            '(e.g. "- [ ] ! foo")'
-        ),
-    )
-    note.set_defaults(func=_cmd_note)
+    _add_list_args(p)
+    p.set_defaults(func=_cmd_note)
 
-    add = sub.add_parser(
-        "add",
-        help="Add a task line to a note",
-    )
-    add.add_argument(
+
+def _add_add_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "text",
         help='Task text. If it is not already a markdown task, it will be prefixed with "- [ ] ".',
     )
-    add.add_argument(
+    p.add_argument(
         "--note",
         help=(
             "Target note name (filename without .md). If omitted, uses "
@@ -904,16 +758,169 @@ def build_parser() -> argparse.ArgumentParser:
             "at the vault root."
         ),
     )
-    add.set_defaults(func=_cmd_add)
+    p.set_defaults(func=_cmd_add)
+
+
+# Subcommand name -> (help, argument builder), in the order shown by --help.
+_CMD_BUILDERS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "inbox": ("List Markdown tasks in the inbox folder", _add_inbox_args),
+    "today": (
+        "List Markdown tasks in today's daily note (Calendar folder, yyyy-mm-dd.md)",
+        _add_today_args,
+    ),
+    "yesterday": (
+        "List Markdown tasks in yesterday's daily note (Calendar folder, yyyy-mm-dd.md)",
+        _add_yesterday_args,
+    ),
+    "tomorrow": (
+        "List Markdown tasks in tomorrow's daily note (Calendar folder, yyyy-mm-dd.md)",
+        _add_tomorrow_args,
+    ),
+    "all": ("List Markdown tasks across the whole vault (all notes)", _add_all_args),
+    "overdue": (
+        "List overdue tasks: tasks in any past daily note and tasks with a "
+        "[[yyyy-mm-dd]] backlink to a past date",
+        _add_overdue_args,
+    ),
+    "note": (
+        "List Markdown tasks in a note by name (searches vault for <name>.md and prints tasks)",
+        _add_note_args,
+    ),
+    "add": ("Add a task line to a note", _add_add_args),
+}
+
+
+def _maybe_load_dotenv() -> None:
+    # During test runs, avoid pulling local developer defaults from a repo .env.
+    # Tests should control env vars explicitly via monkeypatch.
+    if os.environ.get("OT_DISABLE_DOTENV") not in {"1", "true", "yes", "on"}:
+        load_dotenv_if_present()
+
+
+# Value-less flags that the fast path below understands, mapped to their dest.
+_FAST_FLAGS = {
+    "--json": "json",
+    "--color": "color",
+    "-c": "color",
+    "--show-date": "show_date",
+    "--priority-only": "priority_only",
+}
+_FAST_COMMANDS = {
+    "today": _cmd_today,
+    "yesterday": _cmd_yesterday,
+    "tomorrow": _cmd_tomorrow,
+    "overdue": _cmd_overdue,
+    "all": _cmd_all,
+}
+
+
+def _fast_parse_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse the common `ot <command> [flags]` forms without argparse.
+
+    Only commands without positional arguments and only value-less flags are
+    handled. Returns None for anything else (including --help), so the caller
+    falls back to the full parser. The namespace matches what argparse builds.
+    """
+
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return None
+
+    command = argv[0]
+    args = argparse.Namespace(
+        command=command,
+        json=False,
+        color=False,
+        show_date=False,
+        status=None,
+        priority_only=False,
+        func=_FAST_COMMANDS[command],
+    )
+    flags = _FAST_FLAGS
+    if command == "all":
+        args.path = None
+        args.unscheduled = False
+        flags = {**_FAST_FLAGS, "--unscheduled": "unscheduled"}
+
+    for arg in argv[1:]:
+        dest = flags.get(arg)
+        if dest is None:
+            return None
+        setattr(args, dest, True)
+    return args
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    If `command` names a known subcommand, only that subparser is constructed;
+    otherwise (e.g. for --help or a typo) all of them are, so usage and error
+    messages list every command.
+    """
+
+    _maybe_load_dotenv()
+    return _new_parser(command if command in _CMD_BUILDERS else None)
+
+
+def _new_parser(command: str | None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="ot", description="Obsidian tasks CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    for name, (help_text, add_args) in _CMD_BUILDERS.items():
+        if command is not None and name != command:
+            continue
+        add_args(sub.add_parser(name, help=help_text))
 
     return parser
 
 
+# Parsers are never mutated after construction, so `main` reuses one per
+# subcommand (at most len(_CMD_BUILDERS) + 1 entries) across calls.
+_cached_parser = functools.lru_cache(maxsize=None)(_new_parser)
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Each invocation sees the vault as it is now, not as an earlier call scanned it.
+    tasks_mod.clear_vault_index()
+
+    args = _fast_parse_args(argv)
+    _maybe_load_dotenv()
+    if args is None:
+        # Only build the subparser that is actually going to be used.
+        command = argv[0] if argv and argv[0] in _CMD_BUILDERS else None
+        args = _cached_parser(command).parse_args(argv)
+    args.env = _EnvConfig.from_environ()
+
+    if args.command in _INDEXED_COMMANDS and args.env.vault_root and _env_truthy("OT_CACHE"):
+        return _run_with_index(args)
     return int(args.func(args))
 
 
+# Commands that parse many notes with extract_tasks_from_file. For the others,
+# loading the whole index costs more than the one or two notes they parse.
+_INDEXED_COMMANDS = frozenset({"all", "inbox"})
+
+
+def _run_with_index(args: argparse.Namespace) -> int:
+    """Run a command with the parse cache loaded from, and saved back to, disk.
+
+    Notes whose mtime and size match the saved index are not re-read. The index
+    is rewritten only if the command succeeded and parsed something new.
+    """
+
+    from obsidian_tasks import index
+
+    path = index.default_index_path(args.env.vault_root)
+    saved = index.load_index(path)
+    tasks_mod.seed_task_cache(saved)
+    rc = int(args.func(args))
+    rows = tasks_mod.task_cache_rows()
+    if rows != saved:
+        index.save_index(path, rows)
+    return rc
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 
@@ -14,20 +15,31 @@ def load_dotenv_if_present(dotenv_path: Path | None = None) -> None:
     """
 
     import os
+    import stat
 
     p = dotenv_path or (Path.cwd() / ".env")
-    if not p.exists() or not p.is_file():
+    try:
+        st = p.stat()
+    except OSError:
         return
+    if not stat.S_ISREG(st.st_mode):
+        return
+
+    for key, value in _parse_dotenv(str(p), st.st_mtime_ns, st.st_size):
+        os.environ.setdefault(key, value)
+
 
-    for raw_line in p.read_text(encoding="utf-8", errors="replace").splitlines():
+@functools.lru_cache(maxsize=8)
+def _parse_dotenv(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    """KEY/value pairs of a .env file; mtime and size key the cache, so edits are seen."""
+
+    pairs: list[tuple[str, str]] = []
+    for raw_line in Path(path).read_text(encoding="utf-8", errors="replace").splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
+        if not line or line.startswith("#") or "=" not in line:
             continue
         key, value = line.split("=", 1)
         key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if not key:
-            continue
-        os.environ.setdefault(key, value)
+        if key:
+            pairs.append((key, value.strip().strip('"').strip("'")))
+    return tuple(pairs)
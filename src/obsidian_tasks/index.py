@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from obsidian_tasks.tasks import TaskRows
+
+# Bump when the file layout changes; other versions are ignored, not migrated.
+_INDEX_VERSION = 1
+
+
+def default_index_path(vault_root: str | Path) -> Path:
+    """Where the task index of `vault_root` lives, under $XDG_CACHE_HOME/obsidian-tasks/.
+
+    Each vault gets its own file, so switching vaults never loads the other's
+    entries.
+    """
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    root = os.path.abspath(os.path.expanduser(vault_root))
+    digest = hashlib.sha1(root.encode("utf-8")).hexdigest()[:16]
+    return Path(base) / "obsidian-tasks" / f"{digest}.json"
+
+
+def load_index(path: Path) -> TaskRows:
+    """Read a saved index.
+
+    A missing, unreadable or malformed file, or one written by another index
+    version, is treated as an empty index.
+    """
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8", errors="surrogateescape"))
+        if data.get("version") != _INDEX_VERSION:
+            return {}
+        return {
+            key: (int(mtime_ns), int(size), [(int(n), str(raw)) for n, raw in rows])
+            for key, (mtime_ns, size, rows) in data["files"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_index(path: Path, rows: TaskRows) -> None:
+    """Write `rows` to `path`, replacing the previous index atomically.
+
+    The index is only a cache: failures to write it are ignored.
+    """
+
+    import tempfile
+
+    payload = {"version": _INDEX_VERSION, "files": rows}
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temporary name, so overlapping runs never write the same file.
+        # surrogateescape round-trips note paths that are not valid UTF-8.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            errors="surrogateescape",
+            dir=path.parent,
+            prefix=path.name,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_name = f.name
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except (OSError, ValueError):
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
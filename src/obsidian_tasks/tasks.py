@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
+import mmap
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, TypeAlias
+from typing import Callable, Iterable, Iterator, TypeAlias
 
 TaskStatus: TypeAlias = str  # Literal would be nicer, but keep deps minimal.
 
@@ -13,6 +16,29 @@ TaskStatus: TypeAlias = str  # Literal would be nicer, but keep deps minimal.
 _CALENDAR_NOTE_STEM_RE = re.compile(r"^\d{4}(-\d{2}-\d{2})?$")
 _CALENDAR_WIKILINK_RE = re.compile(r"\[\[(\d{4}(?:-\d{2}-\d{2})?)\]\]")
 
+# A task line: optional leading whitespace, "-" or "*", " [", any single char, "]",
+# and at least one more char. \s matches exactly what str.lstrip() strips.
+_TASK_LINE_RE = re.compile(r"\s*[-*] \[.\].", re.DOTALL)
+# The same shape, matched across a whole file: each match is one task line. Lines
+# end at "\n"; a trailing "\r" (CRLF files) is not part of the line.
+_TASK_LINES_RE = re.compile(r"^[^\S\n]*[-*] \[[^\n]\][^\n\r][^\n]*", re.MULTILINE)
+# Task lines that contain a [[yyyy-mm-dd]] link (the lookahead keeps a link right
+# after the checkbox matchable).
+_DATED_TASK_LINES_RE = re.compile(
+    r"^[^\S\n]*[-*] \[[^\n]\](?=[^\n\r])[^\n]*?\[\[\d{4}-\d{2}-\d{2}\]\][^\n]*",
+    re.MULTILINE,
+)
+
+
+def current_date() -> date:
+    """The date the library and CLI treat as today.
+
+    Every "today" default reads the clock through here, so patching this one
+    function freezes the date everywhere.
+    """
+
+    return date.today()
+
 
 def is_calendar_note_path(path: str | Path) -> bool:
     """Return True if the note filename looks like a calendar note.
@@ -23,8 +49,12 @@ def is_calendar_note_path(path: str | Path) -> bool:
     - yyyy-mm-dd.md (daily note, e.g. 2025-01-01.md)
     """
 
-    p = Path(path)
-    return bool(_CALENDAR_NOTE_STEM_RE.match(p.stem))
+    return _is_calendar_stem(Path(path).stem)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_calendar_stem(stem: str) -> bool:
+    return _CALENDAR_NOTE_STEM_RE.match(stem) is not None
 
 
 def contains_calendar_backlink(text: str) -> bool:
@@ -35,7 +65,8 @@ def contains_calendar_backlink(text: str) -> bool:
     - a daily note: [[2025-01-01]]
     """
 
-    return bool(_CALENDAR_WIKILINK_RE.search(text))
+    # Most task lines have no wikilink at all; skip the regex for them.
+    return "[[" in text and _CALENDAR_WIKILINK_RE.search(text) is not None
 
 
 def is_scheduled_task(task: "Task") -> bool:
@@ -74,14 +105,8 @@ def is_priority_task_line(line: str) -> bool:
         "- [ ] ! important"
     """
 
-    if not is_markdown_task_line(line):
-        return False
-
-    s = line.lstrip()
-    # After lstrip(), the line starts with "- [" or "* [".
-    # The checkbox token itself is 5 chars starting at index 2, e.g. "[ ]".
-    # The closing bracket is at index 4.
-    return len(s) >= 8 and s[5:8] == " ! "
+    parsed = _parse_task_line(line)
+    return parsed is not None and parsed[1]
 
 
 def filter_tasks_by_priority(
@@ -109,13 +134,52 @@ def resolve_note_path(*, vault_root: str | Path, note_name: str) -> Path:
     if not wanted:
         raise ValueError("note name is required")
 
-    matches = find_notes_by_name(vault_root=vault, note_name=wanted)
-    if matches:
-        return matches[0]
+    match = find_first_note_by_name(vault_root=vault, note_name=wanted)
+    if match is not None:
+        return match
 
     return vault / f"{wanted}.md"
 
 
+def _decode_note(data: bytes) -> str:
+    """Decode note bytes like `read_text(encoding="utf-8")` with a forgiving fallback.
+
+    Invalid UTF-8 is replaced rather than raised, and newlines are translated
+    the way text mode would.
+    """
+
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_note_text(path: Path) -> str:
+    """Read a note with a single read and a single decode."""
+
+    with open(path, "rb") as f:
+        return _decode_note(f.read())
+
+
+# Notes at least this big are searched through mmap rather than read into memory.
+_MMAP_MIN_BYTES = 1024 * 1024
+
+
+def _read_note_bytes_containing(path: Path, needle: bytes) -> bytes | None:
+    """Return the note's bytes if they contain `needle`, else None.
+
+    Large notes are searched in place via mmap, so a note without the needle is
+    never copied into memory.
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            data = f.read()
+            return data if needle in data else None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:] if mm.find(needle) != -1 else None
+
+
 def normalize_task_text(text: str) -> str:
     """Normalize free-form text into a markdown task line.
 
@@ -145,21 +209,22 @@ def append_task_to_note(*, vault_root: str | Path, note_name: str, text: str) ->
 
     note_path = resolve_note_path(vault_root=vault_root, note_name=note_name)
     note_path.parent.mkdir(parents=True, exist_ok=True)
+    created = not note_path.exists()
 
     task_line = normalize_task_text(text)
 
     existing = ""
     if note_path.exists():
-        try:
-            existing = note_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            existing = note_path.read_text(encoding="utf-8", errors="replace")
+        existing = _read_note_text(note_path)
 
     # Ensure we always append on a fresh line.
     if existing and not existing.endswith("\n"):
         existing += "\n"
 
     note_path.write_text(existing + task_line + "\n", encoding="utf-8")
+    if created:
+        # A new note changes the vault's file list.
+        clear_vault_index()
     return note_path
 
 
@@ -176,21 +241,31 @@ def task_status_from_line(line: str) -> TaskStatus | None:
     not one of the recognized statuses.
     """
 
-    if not is_markdown_task_line(line):
+    parsed = _parse_task_line(line)
+    return None if parsed is None else parsed[0]
+
+
+# Checkbox token -> status. "[X]" is listed so lookups need no lower().
+_CHECKBOX_STATUSES: dict[str, TaskStatus] = {
+    "[ ]": "open",
+    "[x]": "done",
+    "[X]": "done",
+    "[-]": "cancelled",
+    "[>]": "scheduled",
+}
+
+
+def _parse_task_line(line: str) -> tuple[TaskStatus | None, bool] | None:
+    """Classify a line with one match: (status, is_priority), or None if not a task."""
+
+    m = _TASK_LINE_RE.match(line)
+    if m is None:
         return None
 
-    s = line.lstrip()
-    token = s[2:5]  # e.g. "[ ]", "[x]", "[-]" (after leading "- ")
-
-    if token == "[ ]":
-        return "open"
-    if token.lower() == "[x]":
-        return "done"
-    if token == "[-]":
-        return "cancelled"
-    if token == "[>]":
-        return "scheduled"
-    return None
+    # The match ends one char past the checkbox, e.g. "[ ]", "[x]", "[-]"; the
+    # priority marker " ! " starts at that char. No lstrip() copy is needed.
+    end = m.end() - 1
+    return _CHECKBOX_STATUSES.get(line[end - 3 : end]), line[end : end + 3] == " ! "
 
 
 def filter_tasks_by_status(tasks: Iterable[Task], *, status: TaskStatus | None) -> list[Task]:
@@ -223,17 +298,69 @@ def filter_tasks_by_statuses(
     return [t for t in tasks if (st := task_status_from_line(t.raw)) is not None and st in wanted]
 
 
-@dataclass(frozen=True)
+def filter_tasks(
+    tasks: Iterable[Task],
+    *,
+    statuses: Iterable[TaskStatus] | None = None,
+    priority_only: bool = False,
+) -> list[Task]:
+    """Apply the status and priority filters in one pass.
+
+    Same result as `filter_tasks_by_statuses` followed by
+    `filter_tasks_by_priority`, but each task line is parsed only once.
+    """
+
+    if statuses is None and not priority_only:
+        return list(tasks)
+    wanted = None if statuses is None else {s for s in statuses if s}
+    if wanted is not None and not wanted:
+        return []
+
+    out: list[Task] = []
+    for t in tasks:
+        parsed = _parse_task_line(t.raw)
+        if parsed is None:
+            continue
+        status, is_priority = parsed
+        if wanted is not None and status not in wanted:
+            continue
+        if priority_only and not is_priority:
+            continue
+        out.append(t)
+    return out
+
+
+@dataclass(frozen=True, slots=True)
 class Task:
     file: Path
     line_no: int
     raw: str
+    # Task text starting at the checkbox (e.g. "[ ] foo"), computed once on creation
+    # so every consumer doesn't have to re-parse `raw`.
+    display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "display", checkbox_text(self.raw))
 
     @property
     def text(self) -> str:
         return self.raw.strip()
 
 
+def checkbox_text(line: str) -> str:
+    """Return a task line with everything before the checkbox removed.
+
+    Example: "    - [ ] foo" -> "[ ] foo"
+    """
+
+    s = line.lstrip()
+    # Task lines start with "- [" or "* [", so the checkbox is at index 2.
+    if s[2:3] == "[":
+        return s[2:].strip()
+    _, sep, rest = s.partition("[")
+    return (sep + rest).strip() if sep else s.strip()
+
+
 def is_markdown_task_line(line: str) -> bool:
     """Return True if a line looks like an Obsidian/Markdown task.
 
@@ -247,13 +374,7 @@ def is_markdown_task_line(line: str) -> bool:
     - Checkbox char can be space or any single char.
     """
 
-    s = line.lstrip()
-    if not (s.startswith("- [") or s.startswith("* [")):
-        return False
-    # minimal structure: "- [ ]"
-    if len(s) < 6:
-        return False
-    return s[0] in {"-", "*"} and s[1:3] == " [" and s[4] == "]"
+    return _TASK_LINE_RE.match(line) is not None
 
 
 def iter_markdown_files(root: Path) -> Iterable[Path]:
@@ -265,28 +386,270 @@ def iter_markdown_files(root: Path) -> Iterable[Path]:
         return
 
     if root.is_dir():
-        yield from (p for p in sorted(root.rglob("*.md")) if p.is_file())
+        yield from _vault_index(str(root))[0]
 
 
-def extract_tasks_from_file(path: Path) -> list[Task]:
-    tasks: list[Task] = []
+_VaultIndex: TypeAlias = tuple[tuple[Path, ...], dict[str, tuple[Path, ...]]]
+
+# Root -> (mtime_ns of every directory scanned, index built from that scan).
+_VAULT_INDEX_CACHE: dict[str, tuple[tuple[tuple[str, int | None], ...], _VaultIndex]] = {}
+_VAULT_INDEX_MAX_ROOTS = 4
+
+
+def _vault_index(root: str) -> _VaultIndex:
+    """Index the notes under `root`: all paths, and paths by stem.
+
+    The scan is reused while no scanned directory's mtime has changed; adding,
+    removing or renaming an entry updates its parent directory's mtime, so that
+    is one stat per directory instead of a full walk. A change landing within
+    the filesystem's mtime granularity of the scan can be missed; callers that
+    just changed the vault themselves use `clear_vault_index()`.
+    """
+
+    cached = _VAULT_INDEX_CACHE.get(root)
+    if cached is not None and all(_dir_mtime_ns(d) == m for d, m in cached[0]):
+        return cached[1]
+
+    found, dirs = _scan_markdown_paths(root)
+    paths = tuple(map(Path, found))
+    by_stem: dict[str, list[Path]] = {}
+    for p in paths:
+        by_stem.setdefault(p.stem, []).append(p)
+    index = (paths, {stem: tuple(ps) for stem, ps in by_stem.items()})
+
+    _VAULT_INDEX_CACHE.pop(root, None)
+    if len(_VAULT_INDEX_CACHE) >= _VAULT_INDEX_MAX_ROOTS:
+        del _VAULT_INDEX_CACHE[next(iter(_VAULT_INDEX_CACHE))]
+    _VAULT_INDEX_CACHE[root] = (tuple(dirs), index)
+    return index
+
+
+def _dir_mtime_ns(path: str) -> int | None:
     try:
-        content = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # fall back to a forgiving read
-        content = path.read_text(encoding="utf-8", errors="replace")
-
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if is_markdown_task_line(line):
-            tasks.append(Task(file=path, line_no=idx, raw=line.rstrip("\n")))
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def clear_vault_index() -> None:
+    """Drop cached vault scans so the next lookup walks the filesystem again."""
+
+    _VAULT_INDEX_CACHE.clear()
+
+
+def _scan_markdown_paths(root: str) -> tuple[list[str], list[tuple[str, int | None]]]:
+    """Collect `*.md` file paths under `root` with one scandir per directory.
+
+    Matches `sorted(root.rglob("*.md"))` filtered by `is_file()`: symlinked
+    directories are not descended into, unreadable directories are skipped, and
+    paths are ordered component-wise like `Path` comparison.
+
+    Also returns each visited directory with its mtime, taken before it is
+    listed so a concurrent change is seen as stale on the next lookup.
+    """
+
+    found: list[str] = []
+    dirs: list[tuple[str, int | None]] = []
+    stack = [root]
+    while stack:
+        d = stack.pop()
+        dirs.append((d, _dir_mtime_ns(d)))
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        found.append(entry.path)
+                except OSError:
+                    continue
+    found.sort(key=lambda p: p.split(os.sep))
+    return found, dirs
+
+
+def _iter_task_lines(
+    content: str, pattern: re.Pattern[str] = _TASK_LINES_RE
+) -> Iterator[tuple[int, str]]:
+    """Yield (1-based line number, line) for every task line in `content`.
+
+    The whole buffer is scanned with one regex, so non-task lines never become
+    separate Python strings. Line numbers are derived by counting newlines
+    between consecutive matches. `pattern` may narrow the match to a subset of
+    task lines, as long as each match is still one whole line.
+
+    Lines are those of `str.splitlines()`: a note using any other line break
+    (a lone "\r", "\f", "\u2028", ...) is split and matched line by line.
+    """
+
+    if _has_other_line_breaks(content):
+        match = pattern.match
+        for idx, line in enumerate(content.splitlines(), start=1):
+            if match(line):
+                yield idx, line
+        return
+
+    line_no = 1
+    pos = 0
+    count = content.count
+    for m in pattern.finditer(content):
+        start = m.start()
+        line_no += count("\n", pos, start)
+        pos = start
+        yield line_no, m.group().rstrip("\r")
+
+
+def _has_other_line_breaks(content: str) -> bool:
+    """True if `content` has a line break, other than LF or CRLF, that splitlines() splits on.
+
+    Plain substring checks: a regex search over the same characters costs about
+    thirty times as much on a typical vault.
+    """
+
+    return (
+        "\x0b" in content
+        or "\x0c" in content
+        or "\x1c" in content
+        or "\x1d" in content
+        or "\x1e" in content
+        or ("\r" in content and content.count("\r") != content.count("\r\n"))
+        or (
+            not content.isascii()
+            and ("\x85" in content or "\u2028" in content or "\u2029" in content)
+        )
+    )
+
+
+# Absolute path -> (st_mtime_ns, st_size, tasks) from the last time the note was parsed.
+# The stamp cannot see an edit that keeps the size and lands within the
+# filesystem's mtime granularity of the previous parse; such a note stays stale
+# until it changes again or `clear_task_cache()` is called.
+_FILE_TASKS_CACHE: dict[str, tuple[int, int, tuple[Task, ...]]] = {}
+# Past this many notes the oldest quarter is dropped, so a long-running process
+# does not keep one entry for every file it has ever read.
+_FILE_TASKS_CACHE_MAX = 100_000
+
+# Absolute path -> (st_mtime_ns, st_size, [(line_no, raw), ...]) loaded from a saved index
+# (see obsidian_tasks.index). Tasks are only built for the notes a command reads.
+TaskRows: TypeAlias = dict[str, tuple[int, int, list[tuple[int, str]]]]
+_SAVED_TASK_ROWS: TaskRows = {}
+
+
+def extract_tasks_from_file(path: Path) -> list[Task]:
+    """Return the note's tasks, reusing the last parse while the file is unchanged.
+
+    "Unchanged" means the same mtime and size; `clear_task_cache` forgets
+    everything.
+    """
+
+    key = _cache_key(path)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _FILE_TASKS_CACHE.get(key)
+        if cached is not None and cached[:2] == stamp:
+            return list(cached[2])
+        saved = _SAVED_TASK_ROWS.get(key)
+        if saved is not None and saved[:2] == stamp:
+            tasks = [Task(file=path, line_no=line_no, raw=raw) for line_no, raw in saved[2]]
+            _remember_tasks(key, (*stamp, tuple(tasks)))
+            return tasks
+        data = f.read()
+    # Every task line contains "- [" or "* ["; notes without either are skipped
+    # before they are decoded.
+    if b"- [" not in data and b"* [" not in data:
+        tasks = []
+    else:
+        tasks = _tasks_from_content(path, _decode_note(data))
+    _remember_tasks(key, (*stamp, tuple(tasks)))
     return tasks
 
 
+def _remember_tasks(key: str, entry: tuple[int, int, tuple[Task, ...]]) -> None:
+    _FILE_TASKS_CACHE.pop(key, None)
+    _FILE_TASKS_CACHE[key] = entry
+    if len(_FILE_TASKS_CACHE) > _FILE_TASKS_CACHE_MAX:
+        # list(dict) and pop(key, None) are single calls under the GIL, so this
+        # is safe while _map_files threads insert concurrently.
+        for old in list(_FILE_TASKS_CACHE)[: len(_FILE_TASKS_CACHE) // 4]:
+            _FILE_TASKS_CACHE.pop(old, None)
+
+
+def _cache_key(path: str | Path) -> str:
+    """Absolute path string for a note, so saved rows do not depend on the cwd."""
+
+    key = os.fspath(path)
+    return key if os.path.isabs(key) else os.path.abspath(key)
+
+
+def clear_task_cache() -> None:
+    """Forget every note parsed by `extract_tasks_from_file`, and any seeded rows."""
+
+    _FILE_TASKS_CACHE.clear()
+    _SAVED_TASK_ROWS.clear()
+
+
+def seed_task_cache(rows: TaskRows) -> None:
+    """Let `extract_tasks_from_file` reuse rows saved by an earlier run."""
+
+    _SAVED_TASK_ROWS.update(rows)
+
+
+def task_cache_rows() -> TaskRows:
+    """Seeded rows overlaid with everything parsed since, in the same shape.
+
+    Seeded rows under a directory walked since seeding, for notes that walk no
+    longer found (deleted or renamed), are dropped.
+    """
+
+    rows = dict(_SAVED_TASK_ROWS)
+    for root, (_dirs, (paths, _by_stem)) in list(_VAULT_INDEX_CACHE.items()):
+        prefix = os.path.join(_cache_key(root), "")
+        seen = set(map(_cache_key, paths))
+        for key in [k for k in rows if k.startswith(prefix) and k not in seen]:
+            del rows[key]
+    for key, (mtime_ns, size, tasks) in _FILE_TASKS_CACHE.items():
+        rows[key] = (mtime_ns, size, [(t.line_no, t.raw) for t in tasks])
+    return rows
+
+
+def _tasks_from_content(path: Path, content: str) -> list[Task]:
+    return [Task(file=path, line_no=idx, raw=line) for idx, line in _iter_task_lines(content)]
+
+
+# Below this many files a thread pool costs more to start than it saves.
+_PARALLEL_MIN_FILES = 32
+
+
 def extract_tasks(root: Path) -> list[Task]:
-    all_tasks: list[Task] = []
-    for md in iter_markdown_files(root):
-        all_tasks.extend(extract_tasks_from_file(md))
-    return all_tasks
+    return _map_files(extract_tasks_from_file, list(iter_markdown_files(root)))
+
+
+def _map_files(scan: Callable[[Path], list[Task]], files: list[Path]) -> list[Task]:
+    """Run a per-file task scan over `files` and concatenate results in file order.
+
+    Large vaults on multi-core machines use a thread pool; everything else runs
+    serially.
+    """
+
+    cpus = os.cpu_count() or 1
+    # On a single core the threads only add GIL switching on top of the same work.
+    if len(files) < _PARALLEL_MIN_FILES or cpus < 2:
+        out: list[Task] = []
+        for md in files:
+            out.extend(scan(md))
+        return out
+
+    # Imported here: it pulls in threading and logging, which small vaults never need.
+    from concurrent.futures import ThreadPoolExecutor
+
+    # File reads release the GIL, so threads overlap the I/O; map() keeps file order.
+    workers = min(32, cpus * 4, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(chain.from_iterable(ex.map(scan, files)))
 
 
 def resolve_calendar_daily_note_path(
@@ -306,11 +669,11 @@ def resolve_calendar_daily_note_path(
     - for_date: defaults to today
     """
 
-    vault = Path(vault_path or os.environ["OT_VAULT_PATH"]).expanduser()
+    vault = os.path.expanduser(os.fspath(vault_path or os.environ["OT_VAULT_PATH"]))
     cal = calendar_dir or os.environ.get("OT_CALENDAR_DIR", "")
-    d = for_date or date.today()
-    filename = f"{d:%Y-%m-%d}.md"
-    return vault / cal / filename
+    d = for_date or current_date()
+    # Join as strings and build a single Path; `/` would create one per segment.
+    return Path(os.path.join(vault, cal, f"{d.isoformat()}.md"))
 
 
 def extract_tasks_from_today_note(
@@ -327,9 +690,18 @@ def extract_tasks_from_today_note(
     note = resolve_calendar_daily_note_path(
         vault_path=vault_path, calendar_dir=calendar_dir, for_date=for_date
     )
-    if not note.exists() or not note.is_file():
+    # Just try the read: a missing note is the only case that needs handling, and
+    # checking exists()/is_file() first would cost two extra stats.
+    try:
+        content = _read_note_text(note)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         return []
-    return extract_tasks_from_file(note)
+    except PermissionError:
+        # Windows reports reading a directory as a permission error.
+        if note.is_dir():
+            return []
+        raise
+    return _tasks_from_content(note, content)
 
 
 def extract_backlinked_tasks(
@@ -357,31 +729,26 @@ def extract_backlinked_tasks(
     vault = Path(vault_root).expanduser()
     note = Path(note_path).expanduser()
     needle = f"[[{note.stem}]]"
+    needle_bytes = needle.encode("utf-8")
+    skip_note = None if include_note_tasks else note.resolve()
 
-    out: list[Task] = []
-    seen: set[tuple[Path, int]] = set()
+    def scan(md: Path) -> list[Task]:
+        # Most notes never mention the needle: skip them before decoding or scanning.
+        data = _read_note_bytes_containing(md, needle_bytes)
+        if data is None:
+            return []
+        # Same spelling means same file; only resolve (stat) when the spellings differ.
+        if skip_note is not None and (md == note or md.resolve() == skip_note):
+            return []
 
-    for md in iter_markdown_files(vault):
-        if not include_note_tasks and md.resolve() == note.resolve():
-            continue
+        # Each (file, line) is visited once, so the result needs no deduplication.
+        return [
+            Task(file=md, line_no=idx, raw=line)
+            for idx, line in _iter_task_lines(_decode_note(data))
+            if needle in line
+        ]
 
-        try:
-            content = md.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            content = md.read_text(encoding="utf-8", errors="replace")
-
-        for idx, line in enumerate(content.splitlines(), start=1):
-            if needle not in line:
-                continue
-            if not is_markdown_task_line(line):
-                continue
-            key = (md, idx)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(Task(file=md, line_no=idx, raw=line.rstrip("\n")))
-
-    return out
+    return _map_files(scan, list(iter_markdown_files(vault)))
 
 
 def find_notes_by_name(*, vault_root: str | Path, note_name: str) -> list[Path]:
@@ -403,14 +770,53 @@ def find_notes_by_name(*, vault_root: str | Path, note_name: str) -> list[Path]:
     if not wanted:
         return []
 
-    matches = [p for p in vault.rglob("*.md") if p.is_file() and p.stem == wanted]
-    return sorted(matches)
+    return list(_vault_index(str(vault))[1].get(wanted, ()))
+
+
+def find_first_note_by_name(*, vault_root: str | Path, note_name: str) -> Path | None:
+    """Return `find_notes_by_name(...)[0]`, or None, without walking the whole vault.
+
+    Folders are visited depth-first in name order, which is the same order the
+    full listing is sorted in, so the walk can stop at the first match.
+    """
+
+    vault = Path(vault_root).expanduser()
+    wanted = note_name.strip()
+    if not wanted or not vault.is_dir():
+        return None
+
+    filename = f"{wanted}.md"
+    # Stack of iterators over name-sorted folder entries.
+    stack = [iter(sorted(_scandir_entries(str(vault)), key=lambda e: e.name))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(iter(sorted(_scandir_entries(entry.path), key=lambda e: e.name)))
+            elif entry.name == filename and entry.is_file():
+                return Path(entry.path)
+        except OSError:
+            continue
+    return None
+
+
+def _scandir_entries(path: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
 
 
 _DATE_STEM_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
 _DATE_WIKILINK_RE = re.compile(r"\[\[(\d{4}-\d{2}-\d{2})\]\]")
 
 
+# The same few hundred dates recur across daily-note names and [[yyyy-mm-dd]] links.
+@functools.lru_cache(maxsize=4096)
 def try_parse_ymd(value: str) -> date | None:
     """Parse a date in yyyy-mm-dd format, returning None if invalid."""
 
@@ -454,13 +860,27 @@ def iter_daily_notes(
     if not root.exists() or not root.is_dir():
         return
 
-    for p in sorted(root.glob("*.md")):
-        if not p.is_file():
+    # One scandir of the folder: names are parsed before any per-file stat, and
+    # only date-named entries are checked with is_file(). An unreadable folder
+    # yields no notes.
+    found: list[tuple[str, date]] = []
+    for entry in _scandir_entries(os.fspath(root)):
+        name = entry.name
+        if not name.endswith(".md"):
             continue
-        d = try_parse_ymd(p.stem)
+        d = try_parse_ymd(name[:-3])
         if d is None:
             continue
-        yield d, p
+        try:
+            if not entry.is_file():
+                continue
+        except OSError:
+            continue
+        found.append((name, d))
+
+    found.sort()
+    for name, d in found:
+        yield d, root / name
 
 
 def extract_tasks_from_past_daily_notes(
@@ -471,7 +891,7 @@ def extract_tasks_from_past_daily_notes(
 ) -> list[Task]:
     """Extract tasks from all daily notes with date < today."""
 
-    now = today or date.today()
+    now = today or current_date()
     out: list[Task] = []
     for d, p in iter_daily_notes(vault_root=vault_root, calendar_dir=calendar_dir):
         if d >= now:
@@ -487,41 +907,41 @@ def extract_tasks_with_past_date_backlinks(
 ) -> list[Task]:
     """Extract tasks that include a [[yyyy-mm-dd]] wikilink to a past date."""
 
-    now = today or date.today()
+    now = today or current_date()
     vault = Path(vault_root).expanduser()
 
-    out: list[Task] = []
-    seen: set[tuple[Path, int]] = set()
+    def scan(md: Path) -> list[Task]:
+        data = _read_note_bytes_containing(md, b"[[")
+        return [] if data is None else _past_date_backlink_tasks(md, data, now)
 
-    for md in iter_markdown_files(vault):
-        try:
-            content = md.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            content = md.read_text(encoding="utf-8", errors="replace")
+    return _map_files(scan, list(iter_markdown_files(vault)))
 
-        for idx, line in enumerate(content.splitlines(), start=1):
-            if not is_markdown_task_line(line):
-                continue
-            links = _DATE_WIKILINK_RE.findall(line)
-            if not links:
-                continue
-            # If any linked date is in the past, treat the task as overdue.
-            is_overdue = False
-            for link in links:
-                d = try_parse_ymd(link)
-                if d is not None and d < now:
-                    is_overdue = True
-                    break
-            if not is_overdue:
-                continue
 
-            key = (md, idx)
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(Task(file=md, line_no=idx, raw=line.rstrip("\n")))
+def _past_date_backlink_tasks(md: Path, data: bytes, now: date) -> list[Task]:
+    """Tasks in one note (given as raw bytes) that link a date before `now`."""
 
-    return out
+    # Skip notes without any date wikilink before decoding or walking their lines.
+    if b"[[" not in data:
+        return []
+    content = _decode_note(data)
+    if _DATE_WIKILINK_RE.search(content) is None:
+        return []
+
+    found: list[Task] = []
+    # Only task lines that carry a date link are matched at all.
+    for idx, line in _iter_task_lines(content, _DATED_TASK_LINES_RE):
+        # If any linked date is in the past, treat the task as overdue; stop at the
+        # first one.
+        for m in _DATE_WIKILINK_RE.finditer(line):
+            d = try_parse_ymd(m.group(1))
+            if d is not None and d < now:
+                break
+        else:
+            continue
+
+        # Each (file, line) is visited once, so the result needs no deduplication.
+        found.append(Task(file=md, line_no=idx, raw=line))
+    return found
 
 
 def extract_overdue_tasks(
@@ -535,28 +955,33 @@ def extract_overdue_tasks(
     Overdue tasks are:
     - tasks in any past daily note (yyyy-mm-dd.md where date < today)
     - tasks anywhere in the vault that contain a [[yyyy-mm-dd]] wikilink to a past date
+
+    Each note is read once: past daily notes contribute all their tasks, every
+    other note only its past-date backlink tasks. Past daily notes come first,
+    oldest first, followed by backlink tasks in vault order.
     """
 
-    now = today or date.today()
+    now = today or current_date()
+    vault = Path(vault_root).expanduser()
 
-    tasks: list[Task] = []
-    tasks.extend(
-        extract_tasks_from_past_daily_notes(
-            vault_root=vault_root, calendar_dir=calendar_dir, today=now
-        )
-    )
-    tasks.extend(extract_tasks_with_past_date_backlinks(vault_root=vault_root, today=now))
+    past_daily = [
+        p
+        for d, p in iter_daily_notes(vault_root=vault, calendar_dir=calendar_dir)
+        if d < now
+    ]
+    past_daily_set = set(past_daily)
 
-    # Deduplicate by file+line.
-    seen: set[tuple[Path, int]] = set()
-    deduped: list[Task] = []
-    for t in tasks:
-        key = (t.file, t.line_no)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(t)
-    return deduped
+    def scan_daily(md: Path) -> list[Task]:
+        return _tasks_from_content(md, _read_note_text(md))
+
+    def scan_backlinks(md: Path) -> list[Task]:
+        data = _read_note_bytes_containing(md, b"[[")
+        return [] if data is None else _past_date_backlink_tasks(md, data, now)
+
+    # Past daily notes are scanned whether or not the vault walk reaches them
+    # (e.g. a symlinked calendar folder).
+    others = [p for p in iter_markdown_files(vault) if p not in past_daily_set]
+    return _map_files(scan_daily, past_daily) + _map_files(scan_backlinks, others)
 
 
 def extract_tasks_from_note_name(*, vault_root: str | Path, note_name: str) -> list[Task]:
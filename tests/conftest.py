@@ -0,0 +1,104 @@
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from obsidian_tasks import tasks as tasks_mod
+
+WriteVault = Callable[[Path, dict[str, str]], None]
+
+
+def _write_vault(root: Path, files: dict[str, str]) -> None:
+    """Write `{relative path: content}` under `root`, creating each folder once."""
+
+    for parent in {(root / rel).parent for rel in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for rel, content in files.items():
+        (root / rel).write_bytes(content.encode("utf-8"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_task_cache() -> None:
+    """Start every test without notes parsed by an earlier one."""
+
+    tasks_mod.clear_task_cache()
+
+
+@pytest.fixture(autouse=True)
+def today(monkeypatch: pytest.MonkeyPatch) -> date:
+    """Freeze the date the CLI and library treat as today, so no test straddles midnight."""
+
+    frozen = date(2026, 1, 16)
+    monkeypatch.setattr(tasks_mod, "current_date", lambda: frozen)
+    return frozen
+
+
+@pytest.fixture
+def std_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the CLI at `tmp_path` as the vault, daily notes at its root, no colors."""
+
+    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+    monkeypatch.setenv("OT_CALENDAR_DIR", "")
+    monkeypatch.delenv("OT_USE_COLORS", raising=False)
+    monkeypatch.delenv("OT_CACHE", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def write_vault() -> WriteVault:
+    """The `_write_vault(root, files)` helper, for tests that lay out several notes."""
+
+    return _write_vault
+
+
+@pytest.fixture(scope="module")
+def path_vault(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only vault shared by the `all --path` tests.
+
+    Tests must not write to it; anything that mutates a vault uses `tmp_path`.
+    """
+
+    root = tmp_path_factory.mktemp("path_vault")
+    _write_vault(
+        root,
+        {
+            "a.md": "- [ ] a\n",
+            "b.md": "- [ ] b\n",
+            "c.md": "- [ ] c\n",
+            "notes/one.md": "- [ ] one\n",
+            "notes/two.md": "- [ ] two\n",
+            "other.md": "- [ ] other\n",
+            "1_Projects/p.md": "- [ ] project task\n",
+            "1_Projects/p1.md": "- [ ] p1\n",
+        },
+    )
+    (root / "outside").mkdir()
+    return root
+
+
+@pytest.fixture(scope="module")
+def backlink_vault(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only vault linking to `Project X` and `Note`, shared by the backlink tests."""
+
+    root = tmp_path_factory.mktemp("backlink_vault")
+    _write_vault(
+        root,
+        {
+            "Project X.md": "# Project X\n\n- [ ] local task\n",
+            "Note.md": "# Note\n\n- [ ] self task mentions [[Note]]\n",
+            "Other.md": """# Other
+
+- [ ] unrelated
+- [ ] mentions [[Project X]]
+not a task [[Project X]]
+    - [x] indented task with [[Project X]]
+- [ ] other mentions [[Note]]
+""",
+            "Area/Nested.md": """# Nested
+
+* [ ] bullet mentions [[Project X]]
+""",
+        },
+    )
+    return root
@@ -1,6 +1,15 @@
+import json
+import os
+import sys
+import types
 from datetime import date, timedelta
 from pathlib import Path
 
+import pytest
+
+from obsidian_tasks import cli as cli_mod
+from obsidian_tasks import index
+from obsidian_tasks import tasks as tasks_mod
 from obsidian_tasks.cli import (
     ANSI_BLUE,
     ANSI_GREEN,
@@ -8,20 +17,30 @@ from obsidian_tasks.cli import (
     ANSI_RED,
     ANSI_RESET,
     ANSI_YELLOW,
+    _fast_parse_args,
+    build_parser,
     colorize_checkbox_prefix,
     main,
 )
+from obsidian_tasks.env import load_dotenv_if_present
 from obsidian_tasks.tasks import (
+    Task,
     append_task_to_note,
+    checkbox_text,
+    clear_task_cache,
     contains_calendar_backlink,
     extract_backlinked_tasks,
     extract_overdue_tasks,
+    extract_tasks,
     extract_tasks_from_file,
     extract_tasks_from_today_note,
+    filter_tasks,
     filter_tasks_by_priority,
     filter_tasks_by_status,
     filter_tasks_by_statuses,
     filter_tasks_unscheduled,
+    find_first_note_by_name,
+    find_notes_by_name,
     is_calendar_note_path,
     is_markdown_task_line,
     is_priority_task_line,
@@ -83,6 +102,108 @@ not a task
     assert [t.line_no for t in tasks] == [3, 5]
 
 
+def test_extract_tasks_parallel_keeps_file_order(tmp_path: Path, monkeypatch) -> None:
+    for i in range(5):
+        (tmp_path / f"n{i}.md").write_text(f"- [ ] a{i}\ntext\n- [x] b{i}\n", encoding="utf-8")
+
+    serial = extract_tasks(tmp_path)
+    monkeypatch.setattr(tasks_mod, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(tasks_mod.os, "cpu_count", lambda: 4)
+    parallel = extract_tasks(tmp_path)
+
+    assert parallel == serial
+    assert [t.raw for t in parallel][:4] == ["- [ ] a0", "- [x] b0", "- [ ] a1", "- [x] b1"]
+
+
+def test_extract_backlinked_tasks_via_mmap(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "a.md").write_text("- [ ] see [[Proj]]\n- [ ] other\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("- [ ] nothing here\n", encoding="utf-8")
+    expected = extract_backlinked_tasks(vault_root=tmp_path, note_path=tmp_path / "Proj.md")
+
+    monkeypatch.setattr(tasks_mod, "_MMAP_MIN_BYTES", 1)
+    tasks = extract_backlinked_tasks(vault_root=tmp_path, note_path=tmp_path / "Proj.md")
+    assert tasks == expected
+    assert [t.raw for t in tasks] == ["- [ ] see [[Proj]]"]
+
+
+def test_find_first_note_by_name_matches_sorted_listing(tmp_path: Path) -> None:
+    for rel in ("b/Proj.md", "a-b/Proj.md", "a/c/Proj.md", "a.md", "Z/Proj.md/x.md"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("", encoding="utf-8")
+
+    all_matches = find_notes_by_name(vault_root=tmp_path, note_name="Proj")
+    assert find_first_note_by_name(vault_root=tmp_path, note_name="Proj") == all_matches[0]
+    assert all_matches[0] == tmp_path / "a" / "c" / "Proj.md"
+    assert find_first_note_by_name(vault_root=tmp_path, note_name="Nope") is None
+
+
+def test_find_notes_by_name_sees_notes_added_after_a_scan(tmp_path: Path) -> None:
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "Proj.md").write_text("", encoding="utf-8")
+    (tmp_path / "Proj.md").write_text("", encoding="utf-8")
+
+    assert find_notes_by_name(vault_root=tmp_path, note_name="Proj") == [
+        tmp_path / "Proj.md",
+        tmp_path / "b" / "Proj.md",
+    ]
+
+    (tmp_path / "Other.md").write_text("", encoding="utf-8")
+    assert find_notes_by_name(vault_root=tmp_path, note_name="Other") == [tmp_path / "Other.md"]
+
+
+def test_extract_tasks_sees_notes_created_and_deleted_between_calls(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.md").write_text("- [ ] a\n", encoding="utf-8")
+    assert [t.text for t in extract_tasks(tmp_path)] == ["- [ ] a"]
+
+    (tmp_path / "sub" / "b.md").write_text("- [ ] b\n", encoding="utf-8")
+    assert [t.text for t in extract_tasks(tmp_path)] == ["- [ ] a", "- [ ] b"]
+
+    (tmp_path / "a.md").unlink()
+    assert [t.text for t in extract_tasks(tmp_path)] == ["- [ ] b"]
+
+
+def test_extract_tasks_from_file_reparses_only_changed_notes(tmp_path: Path) -> None:
+    f = tmp_path / "a.md"
+    f.write_text("- [ ] one\n", encoding="utf-8")
+
+    first = extract_tasks_from_file(f)
+    first.clear()
+    assert [t.text for t in extract_tasks_from_file(f)] == ["- [ ] one"]
+
+    f.write_text("- [ ] one\n- [ ] two\n", encoding="utf-8")
+    assert [t.text for t in extract_tasks_from_file(f)] == ["- [ ] one", "- [ ] two"]
+
+
+def test_extract_tasks_from_file_crlf_line_endings(tmp_path: Path) -> None:
+    f = tmp_path / "a.md"
+    f.write_bytes(b"# Title\r\n\r\n- [ ] first\r\n- [ ]\r\n  * [x] second \r\n")
+
+    tasks = extract_tasks_from_file(f)
+    assert [t.raw for t in tasks] == ["- [ ] first", "  * [x] second "]
+    assert [t.line_no for t in tasks] == [3, 5]
+
+
+def test_extract_tasks_from_file_splits_lines_like_splitlines(tmp_path: Path) -> None:
+    f = tmp_path / "a.md"
+    content = "- [ ] a\f- [ ] b\x1c* [x] c\u2028text\u2029- [-] d\x85- [ ] e\v\n- [ ] f\n"
+    f.write_text(content, encoding="utf-8")
+
+    expected = [(i, line) for i, line in enumerate(content.splitlines(), 1) if "[" in line]
+    tasks = extract_tasks_from_file(f)
+    assert [(t.line_no, t.raw) for t in tasks] == expected
+    assert [t.line_no for t in tasks] == [1, 2, 3, 5, 6, 8]
+
+
+def test_extract_tasks_from_file_invalid_utf8_and_lone_cr(tmp_path: Path) -> None:
+    f = tmp_path / "a.md"
+    f.write_bytes(b"- [ ] caf\xe9\r- [x] done\n")
+
+    tasks = extract_tasks_from_file(f)
+    assert [t.raw for t in tasks] == ["- [ ] caf\ufffd", "- [x] done"]
+    assert [t.line_no for t in tasks] == [1, 2]
+
+
 def test_task_status_from_line() -> None:
     assert task_status_from_line("- [ ] open") == "open"
     assert task_status_from_line("- [x] done") == "done"
@@ -173,19 +294,52 @@ def test_filter_tasks_by_statuses_multiple(tmp_path: Path) -> None:
     assert [t.text for t in kept] == ["- [x] two", "- [-] three", "- [>] four"]
 
 
+def test_filter_tasks_matches_chained_filters(tmp_path: Path) -> None:
+    f = tmp_path / "a.md"
+    f.write_text(
+        """- [ ] ! one
+- [x] two
+- [X] ! three
+ - [>] four
+- [?] ! five
+""",
+        encoding="utf-8",
+    )
+
+    tasks = extract_tasks_from_file(f)
+    for statuses in (None, [], ["open"], ["done", "scheduled"]):
+        for priority_only in (False, True):
+            expected = filter_tasks_by_priority(
+                filter_tasks_by_statuses(tasks, statuses=statuses), priority_only=priority_only
+            )
+            assert (
+                filter_tasks(tasks, statuses=statuses, priority_only=priority_only) == expected
+            )
+
+
 def test_display_text_strips_prefix() -> None:
     assert _display_text("- [ ] hello") == "[ ] hello"
     assert _display_text("    * [x] done") == "[x] done"
 
 
-def test_resolve_calendar_daily_note_path_default_calendar_dir(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+def test_checkbox_text_and_task_display() -> None:
+    assert checkbox_text("- [ ] hello") == "[ ] hello"
+    assert checkbox_text("    * [x] done  ") == "[x] done"
+    assert checkbox_text("no checkbox") == "no checkbox"
+
+    t = Task(file=Path("a.md"), line_no=1, raw="  - [-] dropped")
+    assert t.display == "[-] dropped"
+    assert t == Task(file=Path("a.md"), line_no=1, raw="  - [-] dropped")
+
+
+def test_resolve_calendar_daily_note_path_default_calendar_dir(tmp_path: Path, std_env) -> None:
     p = resolve_calendar_daily_note_path(for_date=date(2026, 1, 16))
     assert p == tmp_path / "2026-01-16.md"
 
 
-def test_resolve_calendar_daily_note_path_custom_calendar_dir(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+def test_resolve_calendar_daily_note_path_custom_calendar_dir(
+    tmp_path: Path, std_env, monkeypatch
+) -> None:
     monkeypatch.setenv("OT_CALENDAR_DIR", "Calendar")
     p = resolve_calendar_daily_note_path(for_date=date(2026, 1, 16))
     assert p == tmp_path / "Calendar" / "2026-01-16.md"
@@ -239,6 +393,13 @@ not a task
     assert [t.text for t in tasks] == ["- [ ] task one", "- [x] task two"]
 
 
+def test_extract_tasks_from_today_note_missing_or_directory(tmp_path: Path) -> None:
+    assert extract_tasks_from_today_note(vault_path=tmp_path, for_date=date(2026, 1, 16)) == []
+
+    (tmp_path / "2026-01-17.md").mkdir()
+    assert extract_tasks_from_today_note(vault_path=tmp_path, for_date=date(2026, 1, 17)) == []
+
+
 def test_append_task_to_note_creates_note_and_normalizes(tmp_path: Path) -> None:
     note_path = append_task_to_note(vault_root=tmp_path, note_name="Inbox", text="hello")
     assert note_path == tmp_path / "Inbox.md"
@@ -253,8 +414,7 @@ def test_append_task_to_note_preserves_existing_and_appends_newline(tmp_path: Pa
     assert f.read_text(encoding="utf-8") == "# Inbox\n- [ ] second\n"
 
 
-def test_cli_add_uses_default_add_note_env(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+def test_cli_add_uses_default_add_note_env(tmp_path: Path, std_env, monkeypatch) -> None:
     monkeypatch.setenv("OT_DEFAULT_ADD_NOTE", "Inbox")
 
     code = _run_cli(monkeypatch, ["add", "hello from cli"])
@@ -262,118 +422,72 @@ def test_cli_add_uses_default_add_note_env(tmp_path: Path, monkeypatch) -> None:
     assert (tmp_path / "Inbox.md").read_text(encoding="utf-8") == "- [ ] hello from cli\n"
 
 
-def test_cli_all_path_single_file_limits_scope(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
-    (tmp_path / "a.md").write_text("- [ ] from a\n", encoding="utf-8")
-    (tmp_path / "b.md").write_text("- [ ] from b\n", encoding="utf-8")
+def test_cli_all_path_single_file_limits_scope(path_vault: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setenv("OT_VAULT_PATH", str(path_vault))
 
     # Only include tasks from a.md
-    from io import StringIO
-
-    buf = StringIO()
-    monkeypatch.setattr("sys.stdout", buf)
-    code = _run_cli(monkeypatch, ["all", "--path", str(tmp_path / "a.md")])
+    code = _run_cli(monkeypatch, ["all", "--path", str(path_vault / "a.md")])
     assert code == 0
-    assert buf.getvalue().strip().splitlines() == ["[ ] from a"]
-
+    assert capsys.readouterr().out.strip().splitlines() == ["[ ] a"]
 
-def test_cli_all_path_glob_supports_wildcards(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
 
-    notes = tmp_path / "notes"
-    notes.mkdir()
-    (notes / "one.md").write_text("- [ ] one\n", encoding="utf-8")
-    (notes / "two.md").write_text("- [ ] two\n", encoding="utf-8")
-    (tmp_path / "other.md").write_text("- [ ] other\n", encoding="utf-8")
+def test_cli_all_path_glob_supports_wildcards(path_vault: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setenv("OT_VAULT_PATH", str(path_vault))
 
-    from io import StringIO
-
-    buf = StringIO()
-    monkeypatch.setattr("sys.stdout", buf)
-    code = _run_cli(monkeypatch, ["all", "--path", str(notes / "*.md")])
+    code = _run_cli(monkeypatch, ["all", "--path", str(path_vault / "notes" / "*.md")])
     assert code == 0
 
-    out_lines = [line for line in buf.getvalue().splitlines() if line.strip()]
+    out_lines = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
     assert sorted(out_lines) == ["[ ] one", "[ ] two"]
 
 
-def test_cli_all_path_multiple_values_union(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+def test_cli_all_path_multiple_values_union(path_vault: Path, monkeypatch, capsys) -> None:
+    monkeypatch.setenv("OT_VAULT_PATH", str(path_vault))
 
-    (tmp_path / "a.md").write_text("- [ ] a\n", encoding="utf-8")
-    (tmp_path / "b.md").write_text("- [ ] b\n", encoding="utf-8")
-    (tmp_path / "c.md").write_text("- [ ] c\n", encoding="utf-8")
-
-    from io import StringIO
-
-    buf = StringIO()
-    monkeypatch.setattr("sys.stdout", buf)
     code = _run_cli(
         monkeypatch,
         [
             "all",
             "--path",
-            str(tmp_path / "a.md"),
+            str(path_vault / "a.md"),
             "--path",
-            str(tmp_path / "b.md"),
+            str(path_vault / "b.md"),
         ],
     )
     assert code == 0
 
-    out_lines = [line for line in buf.getvalue().splitlines() if line.strip()]
+    out_lines = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
     assert sorted(out_lines) == ["[ ] a", "[ ] b"]
 
 
-def test_cli_all_path_relative_is_relative_to_vault_root(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
-    # Create a subfolder inside the vault.
-    projects = tmp_path / "1_Projects"
-    projects.mkdir()
-    (projects / "p.md").write_text("- [ ] project task\n", encoding="utf-8")
+def test_cli_all_path_relative_is_relative_to_vault_root(
+    path_vault: Path, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("OT_VAULT_PATH", str(path_vault))
 
     # Change CWD to something else to ensure we don't resolve relative to CWD.
-    outside = tmp_path / "outside"
-    outside.mkdir()
-    monkeypatch.chdir(outside)
-
-    from io import StringIO
-
-    buf = StringIO()
-    monkeypatch.setattr("sys.stdout", buf)
+    monkeypatch.chdir(path_vault / "outside")
 
     code = _run_cli(monkeypatch, ["all", "--path", "1_Projects/p.md"])
     assert code == 0
-    assert buf.getvalue().strip().splitlines() == ["[ ] project task"]
-
-
-def test_cli_all_path_relative_glob_is_relative_to_vault_root(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
-    projects = tmp_path / "1_Projects"
-    projects.mkdir()
-    (projects / "a.md").write_text("- [ ] a\n", encoding="utf-8")
-    (projects / "b.md").write_text("- [ ] b\n", encoding="utf-8")
+    assert capsys.readouterr().out.strip().splitlines() == ["[ ] project task"]
 
-    outside = tmp_path / "outside"
-    outside.mkdir()
-    monkeypatch.chdir(outside)
 
-    from io import StringIO
+def test_cli_all_path_relative_glob_is_relative_to_vault_root(
+    path_vault: Path, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("OT_VAULT_PATH", str(path_vault))
 
-    buf = StringIO()
-    monkeypatch.setattr("sys.stdout", buf)
+    monkeypatch.chdir(path_vault / "outside")
 
     code = _run_cli(monkeypatch, ["all", "--path", "1_Projects/*.md"])
     assert code == 0
 
-    out_lines = [line for line in buf.getvalue().splitlines() if line.strip()]
-    assert sorted(out_lines) == ["[ ] a", "[ ] b"]
+    out_lines = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
+    assert sorted(out_lines) == ["[ ] p1", "[ ] project task"]
 
 
-def test_cli_add_note_flag_overrides_env(tmp_path: Path, monkeypatch) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
+def test_cli_add_note_flag_overrides_env(tmp_path: Path, std_env, monkeypatch) -> None:
     monkeypatch.setenv("OT_DEFAULT_ADD_NOTE", "Inbox")
 
     code = _run_cli(monkeypatch, ["add", "--note", "Work", "do it"])
@@ -382,9 +496,7 @@ def test_cli_add_note_flag_overrides_env(tmp_path: Path, monkeypatch) -> None:
     assert (tmp_path / "Work.md").read_text(encoding="utf-8") == "- [ ] do it\n"
 
 
-def test_cli_all_priority_only_filters(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
+def test_cli_all_priority_only_filters(tmp_path: Path, std_env, monkeypatch, capsys) -> None:
     (tmp_path / "a.md").write_text(
         """- [ ] ! prio
 - [ ] normal
@@ -398,9 +510,7 @@ def test_cli_all_priority_only_filters(tmp_path: Path, monkeypatch, capsys) -> N
     assert out == ["[ ] ! prio"]
 
 
-def test_cli_all_unscheduled_filters(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
+def test_cli_all_unscheduled_filters(tmp_path: Path, std_env, monkeypatch, capsys) -> None:
     (tmp_path / "2025-01-01.md").write_text("- [ ] in daily\n", encoding="utf-8")
     (tmp_path / "a.md").write_text(
         """- [ ] linked [[2025-01-01]]
@@ -443,37 +553,11 @@ def test_colorize_checkbox_prefix() -> None:
     assert colorize_checkbox_prefix("hello") == "hello"
 
 
-def test_extract_backlinked_tasks_finds_tasks_across_vault(tmp_path: Path) -> None:
-    vault = tmp_path
-
+def test_extract_backlinked_tasks_finds_tasks_across_vault(backlink_vault: Path) -> None:
     # The note we are linking to
-    note = vault / "Project X.md"
-    note.write_text("# Project X\n\n- [ ] local task\n", encoding="utf-8")
-
-    other = vault / "Other.md"
-    other.write_text(
-        """# Other
-
-- [ ] unrelated
-- [ ] mentions [[Project X]]
-not a task [[Project X]]
-    - [x] indented task with [[Project X]]
-""",
-        encoding="utf-8",
-    )
-
-    nested_dir = vault / "Area"
-    nested_dir.mkdir()
-    nested = nested_dir / "Nested.md"
-    nested.write_text(
-        """# Nested
-
-* [ ] bullet mentions [[Project X]]
-""",
-        encoding="utf-8",
-    )
+    note = backlink_vault / "Project X.md"
 
-    tasks = extract_backlinked_tasks(vault_root=vault, note_path=note)
+    tasks = extract_backlinked_tasks(vault_root=backlink_vault, note_path=note)
     assert sorted(t.text for t in tasks) == sorted(
         [
             "- [ ] mentions [[Project X]]",
@@ -483,41 +567,24 @@ not a task [[Project X]]
     )
 
 
-def test_extract_backlinked_tasks_can_exclude_note_itself(tmp_path: Path) -> None:
-    vault = tmp_path
-    note = vault / "Note.md"
-    note.write_text(
-        """# Note
-
-- [ ] self task mentions [[Note]]
-""",
-        encoding="utf-8",
-    )
-    other = vault / "Other.md"
-    other.write_text("- [ ] other mentions [[Note]]\n", encoding="utf-8")
+def test_extract_backlinked_tasks_can_exclude_note_itself(backlink_vault: Path) -> None:
+    note = backlink_vault / "Note.md"
 
     tasks = extract_backlinked_tasks(
-        vault_root=vault, note_path=note, include_note_tasks=False
+        vault_root=backlink_vault, note_path=note, include_note_tasks=False
     )
     assert [t.text for t in tasks] == ["- [ ] other mentions [[Note]]"]
 
 
-def test_cli_today_includes_backlinked_tasks(tmp_path: Path, monkeypatch, capsys) -> None:
+def test_cli_today_includes_backlinked_tasks(tmp_path: Path, std_env, capsys, today) -> None:
     # Arrange a minimal vault + today's note.
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    # Ensure the CLI looks in the vault root for the daily note.
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
 
-def test_cli_note_prints_tasks_from_named_note(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
+def test_cli_note_prints_tasks_from_named_note(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
     note = tmp_path / "Project X.md"
     note.write_text(
         """# Project X
@@ -535,9 +602,7 @@ not a task
     assert out.splitlines() == ["[ ] first", "[x] second"]
 
 
-def test_cli_note_errors_when_note_missing(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-
+def test_cli_note_errors_when_note_missing(tmp_path: Path, std_env, monkeypatch, capsys) -> None:
     rc = _run_cli(monkeypatch, ["note", "Does Not Exist"])
     assert rc == 2
     err = capsys.readouterr().err
@@ -545,11 +610,8 @@ def test_cli_note_errors_when_note_missing(tmp_path: Path, monkeypatch, capsys)
 
 
 def test_cli_note_aggregates_tasks_when_multiple_notes_match(
-    tmp_path: Path, monkeypatch, capsys
+    tmp_path: Path, std_env, monkeypatch, capsys
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
     a_dir = tmp_path / "A"
     b_dir = tmp_path / "B"
     a_dir.mkdir()
@@ -564,13 +626,8 @@ def test_cli_note_aggregates_tasks_when_multiple_notes_match(
     assert sorted(out.splitlines()) == sorted(["[ ] from a", "[x] from b"])
 
 
-def test_cli_today_status_filter_open(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+def test_cli_today_status_filter_open(tmp_path: Path, std_env, monkeypatch, capsys, today) -> None:
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text(
         """# Today
 
@@ -587,13 +644,10 @@ def test_cli_today_status_filter_open(tmp_path: Path, monkeypatch, capsys) -> No
     assert out == ["[ ] open one"]
 
 
-def test_cli_today_status_filter_multiple(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+def test_cli_today_status_filter_multiple(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text(
         """# Today
 
@@ -610,19 +664,17 @@ def test_cli_today_status_filter_multiple(tmp_path: Path, monkeypatch, capsys) -
     assert out == ["[x] done one", "[-] cancelled one"]
 
 
-def test_cli_yesterday_includes_backlinked_tasks(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    yesterday = date.today() - timedelta(days=1)
+def test_cli_yesterday_includes_backlinked_tasks(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
+    yesterday = today - timedelta(days=1)
 
-    note = tmp_path / f"{yesterday:%Y-%m-%d}.md"
+    note = tmp_path / f"{yesterday.isoformat()}.md"
     note.write_text("# Yesterday\n\n- [ ] local\n", encoding="utf-8")
 
     other = tmp_path / "Work.md"
     other.write_text(
-        f"- [ ] follow up [[{yesterday:%Y-%m-%d}]]\n",
+        f"- [ ] follow up [[{yesterday.isoformat()}]]\n",
         encoding="utf-8",
     )
 
@@ -633,19 +685,17 @@ def test_cli_yesterday_includes_backlinked_tasks(tmp_path: Path, monkeypatch, ca
     assert sorted(out) == sorted(["[ ] local", "[ ] follow up"])
 
 
-def test_cli_tomorrow_includes_backlinked_tasks(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    tomorrow = date.today() + timedelta(days=1)
+def test_cli_tomorrow_includes_backlinked_tasks(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
+    tomorrow = today + timedelta(days=1)
 
-    note = tmp_path / f"{tomorrow:%Y-%m-%d}.md"
+    note = tmp_path / f"{tomorrow.isoformat()}.md"
     note.write_text("# Tomorrow\n\n- [ ] local\n", encoding="utf-8")
 
     other = tmp_path / "Work.md"
     other.write_text(
-        f"- [ ] follow up [[{tomorrow:%Y-%m-%d}]]\n",
+        f"- [ ] follow up [[{tomorrow.isoformat()}]]\n",
         encoding="utf-8",
     )
 
@@ -656,13 +706,8 @@ def test_cli_tomorrow_includes_backlinked_tasks(tmp_path: Path, monkeypatch, cap
     assert sorted(out) == sorted(["[ ] local", "[ ] follow up"])
 
 
-def test_cli_today_no_color_by_default(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+def test_cli_today_no_color_by_default(tmp_path: Path, std_env, monkeypatch, capsys, today) -> None:
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today"])
@@ -672,13 +717,12 @@ def test_cli_today_no_color_by_default(tmp_path: Path, monkeypatch, capsys) -> N
     assert out == "[ ] local\n"
 
 
-def test_cli_today_uses_colors_from_env(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
+def test_cli_today_uses_colors_from_env(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
     monkeypatch.setenv("OT_USE_COLORS", "1")
 
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today"])
@@ -688,13 +732,12 @@ def test_cli_today_uses_colors_from_env(tmp_path: Path, monkeypatch, capsys) ->
     assert out == f"{ANSI_BLUE}[ ]{ANSI_RESET} local\n"
 
 
-def test_cli_today_uses_colors_from_ot_env(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
+def test_cli_today_uses_colors_from_ot_env(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
     monkeypatch.setenv("OT_USE_COLORS", "true")
 
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today"])
@@ -704,18 +747,15 @@ def test_cli_today_uses_colors_from_ot_env(tmp_path: Path, monkeypatch, capsys)
     assert out == f"{ANSI_BLUE}[ ]{ANSI_RESET} local\n"
 
 
-def test_cli_today_uses_colors_from_dotenv(tmp_path: Path, monkeypatch, capsys) -> None:
+def test_cli_today_uses_colors_from_dotenv(tmp_path: Path, monkeypatch, capsys, today) -> None:
     # Simulate running from a directory containing a .env file.
     monkeypatch.chdir(tmp_path)
     (tmp_path / ".env").write_text(
-        'OT_VAULT_PATH="{vault}"\nOT_CALENDAR_DIR=""\nOT_USE_COLORS=1\n'.format(
-            vault=str(tmp_path)
-        ),
+        f'OT_VAULT_PATH="{tmp_path}"\nOT_CALENDAR_DIR=""\nOT_USE_COLORS=1\n',
         encoding="utf-8",
     )
 
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today"], disable_dotenv=False)
@@ -725,10 +765,7 @@ def test_cli_today_uses_colors_from_dotenv(tmp_path: Path, monkeypatch, capsys)
     assert out == f"{ANSI_BLUE}[ ]{ANSI_RESET} local\n"
 
 
-def test_cli_all_lists_tasks_across_vault(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
+def test_cli_all_lists_tasks_across_vault(tmp_path: Path, std_env, monkeypatch, capsys) -> None:
     (tmp_path / "A.md").write_text(
         """# A
 
@@ -754,14 +791,88 @@ not a task
     assert sorted(out) == sorted(["[ ] a1", "[x] a2", "[ ] b1"])
 
 
-def test_cli_all_json_includes_file_text_and_line_number(
+def test_cli_all_with_ot_cache_reuses_saved_index(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("OT_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    (tmp_path / "A.md").write_text("- [ ] a1\n", encoding="utf-8")
+
+    assert _run_cli(monkeypatch, ["all"]) == 0
+    assert len(list((tmp_path / ".cache" / "obsidian-tasks").glob("*.json"))) == 1
+
+    # A fresh process: nothing in memory, so the tasks must come from the index.
+    clear_task_cache()
+    monkeypatch.setattr(tasks_mod, "_tasks_from_content", None)
+    assert _run_cli(monkeypatch, ["all"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["[ ] a1", "[ ] a1"]
+
+
+def test_cli_all_with_ot_cache_prunes_removed_notes(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("OT_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    (tmp_path / "A.md").write_text("- [ ] a1\n", encoding="utf-8")
+    assert _run_cli(monkeypatch, ["all"]) == 0
+
+    (tmp_path / "A.md").rename(tmp_path / "B.md")
+    clear_task_cache()
+    assert _run_cli(monkeypatch, ["all"]) == 0
+
+    saved = index.load_index(index.default_index_path(str(tmp_path)))
+    assert list(saved) == [str(tmp_path / "B.md")]
+
+
+def test_cli_all_with_ot_cache_keys_rows_by_absolute_path(
     tmp_path: Path, monkeypatch, capsys
 ) -> None:
-    import json
+    monkeypatch.setenv("OT_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    monkeypatch.setenv("OT_VAULT_PATH", "vault")
+    (tmp_path / "vault").mkdir()
+    (tmp_path / "vault" / "A.md").write_text("- [ ] a1\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    assert _run_cli(monkeypatch, ["all"]) == 0
+
+    saved = index.load_index(index.default_index_path(str(tmp_path / "vault")))
+    assert list(saved) == [str(tmp_path / "vault" / "A.md")]
+
+
+def test_cli_with_ot_cache_writes_no_index_without_vault_or_on_error(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
+    monkeypatch.setenv("OT_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    (tmp_path / "Inbox.md").write_text("- [ ] i1\n", encoding="utf-8")
+
+    monkeypatch.delenv("OT_VAULT_PATH")
+    assert _run_cli(monkeypatch, ["inbox", "--path", str(tmp_path / "Inbox.md")]) == 0
+    assert not (tmp_path / ".cache").exists()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
 
     monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
+    monkeypatch.setattr(tasks_mod, "filter_tasks", fail)
+    with pytest.raises(RuntimeError):
+        _run_cli(monkeypatch, ["all"])
+    assert not (tmp_path / ".cache").exists()
+
 
+def test_save_index_round_trips_undecodable_note_names(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "index.json"
+    rows = {os.fsdecode(b"/vault/\xff.md"): (1, 2, [(3, "- [ ] x")])}
+    index.save_index(path, rows)
+
+    assert index.load_index(path) == rows
+    assert [p.name for p in path.parent.iterdir()] == ["index.json"]
+
+
+def test_cli_all_json_includes_file_text_and_line_number(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
     (tmp_path / "A.md").write_text("- [ ] a1\n", encoding="utf-8")
     (tmp_path / "B.md").write_text("- [x] b1\n", encoding="utf-8")
 
@@ -776,43 +887,65 @@ def test_cli_all_json_includes_file_text_and_line_number(
     assert {p["line_number"] for p in payload} == {1}
 
 
-def test_extract_overdue_tasks_includes_past_daily_notes_and_past_backlinks(
-    tmp_path: Path, monkeypatch
+def test_cli_all_json_with_orjson_matches_stdlib_output(
+    tmp_path: Path, std_env, monkeypatch, capsys
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
+    batches = []
+
+    def fake_dumps(obj, option=0):
+        assert option & fake.OPT_INDENT_2
+        batches.append(len(obj))
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return data + b"\n" if option & fake.OPT_APPEND_NEWLINE else data
+
+    fake = types.ModuleType("orjson")
+    fake.OPT_INDENT_2 = 1
+    fake.OPT_APPEND_NEWLINE = 2
+    fake.dumps = fake_dumps
+
+    (tmp_path / "A.md").write_text("- [ ] a1 ü\n- [x] a2 \"q\"\n", encoding="utf-8")
+    (tmp_path / "B.md").write_text("- [ ] b1\n- [ ] b2\n- [-] b3\n", encoding="utf-8")
+    (tmp_path / "Empty").mkdir()
+    monkeypatch.setattr(cli_mod, "_JSON_BATCH_RECORDS", 2)
+
+    outputs = {}
+    for name, module in (("stdlib", None), ("orjson", fake)):
+        monkeypatch.setitem(sys.modules, "orjson", module)
+        for argv in (["all", "--json"], ["all", "--json", "--path", "Empty"]):
+            assert _run_cli(monkeypatch, argv) == 0
+            outputs.setdefault(name, []).append(capsys.readouterr().out)
+
+    assert batches == [2, 2, 1]
+    assert outputs["orjson"] == outputs["stdlib"]
+    assert len(json.loads(outputs["stdlib"][0])) == 5
+    assert outputs["stdlib"][1] == "[]\n"
 
-    today = date.today()
+
+def test_extract_overdue_tasks_includes_past_daily_notes_and_past_backlinks(
+    tmp_path: Path, std_env, write_vault, today
+) -> None:
     yesterday = today - timedelta(days=1)
     tomorrow = today + timedelta(days=1)
 
-    # Past daily note (overdue)
-    (tmp_path / f"{yesterday:%Y-%m-%d}.md").write_text(
-        "# Yesterday\n\n- [ ] overdue from daily\n",
-        encoding="utf-8",
-    )
-    # Today's note (not overdue)
-    (tmp_path / f"{today:%Y-%m-%d}.md").write_text(
-        "# Today\n\n- [ ] today local\n",
-        encoding="utf-8",
-    )
-    # Future note (not overdue)
-    (tmp_path / f"{tomorrow:%Y-%m-%d}.md").write_text(
-        "# Tomorrow\n\n- [ ] future local\n",
-        encoding="utf-8",
-    )
-
-    # Backlink in some other note
-    (tmp_path / "Work.md").write_text(
-        "\n".join(
-            [
-                f"- [ ] follow up [[{yesterday:%Y-%m-%d}]]",
-                f"- [ ] scheduled [[{tomorrow:%Y-%m-%d}]]",
-                "- [ ] invalid backlink [[2026-99-99]]",
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
+    write_vault(
+        tmp_path,
+        {
+            # Past daily note (overdue)
+            f"{yesterday.isoformat()}.md": "# Yesterday\n\n- [ ] overdue from daily\n",
+            # Today's note (not overdue)
+            f"{today.isoformat()}.md": "# Today\n\n- [ ] today local\n",
+            # Future note (not overdue)
+            f"{tomorrow.isoformat()}.md": "# Tomorrow\n\n- [ ] future local\n",
+            # Backlink in some other note
+            "Work.md": "\n".join(
+                [
+                    f"- [ ] follow up [[{yesterday.isoformat()}]]",
+                    f"- [ ] scheduled [[{tomorrow.isoformat()}]]",
+                    "- [ ] invalid backlink [[2026-99-99]]",
+                ]
+            )
+            + "\n",
+        },
     )
 
     tasks = extract_overdue_tasks(
@@ -823,29 +956,76 @@ def test_extract_overdue_tasks_includes_past_daily_notes_and_past_backlinks(
 
     texts = sorted(t.text for t in tasks)
     assert "- [ ] overdue from daily" in texts
-    assert f"- [ ] follow up [[{yesterday:%Y-%m-%d}]]" in texts
+    assert f"- [ ] follow up [[{yesterday.isoformat()}]]" in texts
 
     # Not overdue
     assert "- [ ] today local" not in texts
     assert "- [ ] future local" not in texts
-    assert f"- [ ] scheduled [[{tomorrow:%Y-%m-%d}]]" not in texts
+    assert f"- [ ] scheduled [[{tomorrow.isoformat()}]]" not in texts
     assert "- [ ] invalid backlink [[2026-99-99]]" not in texts
 
 
-def test_cli_overdue_lists_overdue_tasks(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
+def test_extract_overdue_tasks_lists_past_daily_notes_by_date_then_backlinks(
+    tmp_path: Path, write_vault, today
+) -> None:
+    older = (today - timedelta(days=30)).isoformat()
+    newer = (today - timedelta(days=2)).isoformat()
+    write_vault(
+        tmp_path,
+        {
+            "A.md": f"- [ ] a backlink [[{newer}]]\n",
+            f"Calendar/{newer}.md": f"- [ ] newer daily\n- [ ] self link [[{older}]]\n",
+            f"Calendar/{older}.md": "- [ ] older daily\n",
+            "Z.md": f"- [ ] z backlink [[{older}]]\n",
+        },
+    )
 
-    today = date.today()
+    tasks = extract_overdue_tasks(vault_root=tmp_path, calendar_dir="Calendar", today=today)
+    assert [t.text for t in tasks] == [
+        "- [ ] older daily",
+        "- [ ] newer daily",
+        f"- [ ] self link [[{older}]]",
+        f"- [ ] a backlink [[{newer}]]",
+        f"- [ ] z backlink [[{older}]]",
+    ]
+
+
+def test_extract_overdue_tasks_skips_unreadable_calendar_folder(
+    tmp_path: Path, monkeypatch, write_vault, today
+) -> None:
+    yesterday = today - timedelta(days=1)
+    write_vault(
+        tmp_path,
+        {
+            f"Calendar/{yesterday.isoformat()}.md": "- [ ] hidden\n",
+            "Work.md": f"- [ ] follow up [[{yesterday.isoformat()}]]\n",
+        },
+    )
+    calendar = os.fspath(tmp_path / "Calendar")
+    real_scandir = os.scandir
+
+    def scandir(path="."):
+        if os.fspath(path) == calendar:
+            raise PermissionError(13, "Permission denied", calendar)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    tasks = extract_overdue_tasks(vault_root=tmp_path, calendar_dir="Calendar", today=today)
+    assert [t.text for t in tasks] == [f"- [ ] follow up [[{yesterday.isoformat()}]]"]
+
+
+def test_cli_overdue_lists_overdue_tasks(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
     yesterday = today - timedelta(days=1)
 
-    (tmp_path / f"{yesterday:%Y-%m-%d}.md").write_text(
+    (tmp_path / f"{yesterday.isoformat()}.md").write_text(
         "# Yesterday\n\n- [ ] overdue from daily\n- [x] done from daily\n",
         encoding="utf-8",
     )
     (tmp_path / "Work.md").write_text(
-        f"- [ ] follow up [[{yesterday:%Y-%m-%d}]]\n",
+        f"- [ ] follow up [[{yesterday.isoformat()}]]\n",
         encoding="utf-8",
     )
 
@@ -858,15 +1038,12 @@ def test_cli_overdue_lists_overdue_tasks(tmp_path: Path, monkeypatch, capsys) ->
     assert "[x] done from daily" not in out
 
 
-def test_cli_overdue_status_filter_open(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
+def test_cli_overdue_status_filter_open(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
     yesterday = today - timedelta(days=1)
 
-    (tmp_path / f"{yesterday:%Y-%m-%d}.md").write_text(
+    (tmp_path / f"{yesterday.isoformat()}.md").write_text(
         "# Yesterday\n\n- [ ] open one\n- [x] done one\n- [-] cancelled one\n",
         encoding="utf-8",
     )
@@ -877,15 +1054,12 @@ def test_cli_overdue_status_filter_open(tmp_path: Path, monkeypatch, capsys) ->
     assert out == ["[ ] open one"]
 
 
-def test_cli_overdue_status_filter_can_include_done(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
+def test_cli_overdue_status_filter_can_include_done(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
     yesterday = today - timedelta(days=1)
 
-    (tmp_path / f"{yesterday:%Y-%m-%d}.md").write_text(
+    (tmp_path / f"{yesterday.isoformat()}.md").write_text(
         "# Yesterday\n\n- [ ] open one\n- [x] done one\n",
         encoding="utf-8",
     )
@@ -896,30 +1070,22 @@ def test_cli_overdue_status_filter_can_include_done(tmp_path: Path, monkeypatch,
     assert sorted(out) == sorted(["[ ] open one", "[x] done one"])
 
 
-def test_cli_today_show_date_prefixes_daily_note_date(tmp_path: Path, monkeypatch, capsys) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+def test_cli_today_show_date_prefixes_daily_note_date(
+    tmp_path: Path, std_env, monkeypatch, capsys, today
+) -> None:
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today", "--show-date"])
     assert rc == 0
     out = capsys.readouterr().out.splitlines()
-    assert out == [f"{today:%Y-%m-%d} [ ] local"]
+    assert out == [f"{today.isoformat()} [ ] local"]
 
 
 def test_cli_today_show_date_colors_date_blue_when_color_enabled(
-    tmp_path: Path, monkeypatch, capsys
+    tmp_path: Path, std_env, monkeypatch, capsys, today
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.setenv("OT_CALENDAR_DIR", "")
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
-    note = tmp_path / f"{today:%Y-%m-%d}.md"
+    note = tmp_path / f"{today.isoformat()}.md"
     note.write_text("# Today\n\n- [ ] local\n", encoding="utf-8")
 
     rc = _run_cli(monkeypatch, ["today", "--show-date", "--color"])
@@ -927,27 +1093,23 @@ def test_cli_today_show_date_colors_date_blue_when_color_enabled(
 
     out = capsys.readouterr().out
     assert out == (
-        f"{ANSI_YELLOW}{today:%Y-%m-%d}{ANSI_RESET} "
+        f"{ANSI_YELLOW}{today.isoformat()}{ANSI_RESET} "
         f"{ANSI_BLUE}[ ]{ANSI_RESET} local\n"
     )
 
 
 def test_cli_all_show_date_colors_past_today_future_dates(
-    tmp_path: Path, monkeypatch, capsys
+    tmp_path: Path, std_env, monkeypatch, capsys, today
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
-    today = date.today()
     past = today - timedelta(days=1)
     future = today + timedelta(days=1)
 
     (tmp_path / "A.md").write_text(
         "\n".join(
             [
-                f"- [ ] past [[{past:%Y-%m-%d}]]",
-                f"- [ ] today [[{today:%Y-%m-%d}]]",
-                f"- [ ] future [[{future:%Y-%m-%d}]]",
+                f"- [ ] past [[{past.isoformat()}]]",
+                f"- [ ] today [[{today.isoformat()}]]",
+                f"- [ ] future [[{future.isoformat()}]]",
             ]
         )
         + "\n",
@@ -959,18 +1121,15 @@ def test_cli_all_show_date_colors_past_today_future_dates(
 
     out = capsys.readouterr().out.splitlines()
     assert out == [
-        f"{ANSI_RED}{past:%Y-%m-%d}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} past",
-        f"{ANSI_YELLOW}{today:%Y-%m-%d}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} today",
-        f"{ANSI_GREEN}{future:%Y-%m-%d}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} future",
+        f"{ANSI_RED}{past.isoformat()}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} past",
+        f"{ANSI_YELLOW}{today.isoformat()}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} today",
+        f"{ANSI_GREEN}{future.isoformat()}{ANSI_RESET} {ANSI_BLUE}[ ]{ANSI_RESET} future",
     ]
 
 
 def test_cli_all_show_date_uses_first_backlink_date_when_not_in_daily_note(
-    tmp_path: Path, monkeypatch, capsys
+    tmp_path: Path, std_env, monkeypatch, capsys
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
     (tmp_path / "Work.md").write_text(
         "- [ ] follow up [[2026-01-16]]\n",
         encoding="utf-8",
@@ -984,11 +1143,8 @@ def test_cli_all_show_date_uses_first_backlink_date_when_not_in_daily_note(
 
 
 def test_cli_all_show_date_sorts_by_date_and_puts_undated_last(
-    tmp_path: Path, monkeypatch, capsys
+    tmp_path: Path, std_env, monkeypatch, capsys
 ) -> None:
-    monkeypatch.setenv("OT_VAULT_PATH", str(tmp_path))
-    monkeypatch.delenv("OT_USE_COLORS", raising=False)
-
     (tmp_path / "A.md").write_text(
         "\n".join(
             [
@@ -1010,3 +1166,132 @@ def test_cli_all_show_date_sorts_by_date_and_puts_undated_last(
         "2026-01-20 [ ] later",
         "[ ] no date here",
     ]
+
+
+def test_cli_all_json_matches_indented_json_dumps(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
+    (tmp_path / "A.md").write_text('- [ ] a1 ünïcode\n- [x] a2 "quoted"\n', encoding="utf-8")
+
+    rc = _run_cli(monkeypatch, ["all", "--json"])
+    assert rc == 0
+
+    out = capsys.readouterr().out
+    assert out == json.dumps(json.loads(out), ensure_ascii=False, indent=2) + "\n"
+    assert [p["text"] for p in json.loads(out)] == ["[ ] a1 ünïcode", '[x] a2 "quoted"']
+
+
+def test_cli_all_json_empty_vault_prints_empty_list(
+    tmp_path: Path, std_env, monkeypatch, capsys
+) -> None:
+    rc = _run_cli(monkeypatch, ["all", "--json"])
+    assert rc == 0
+    assert capsys.readouterr().out == "[]\n"
+
+
+def test_cli_inbox_uses_inbox_path_env_without_vault(tmp_path: Path, monkeypatch, capsys) -> None:
+    monkeypatch.delenv("OT_VAULT_PATH", raising=False)
+    monkeypatch.delenv("OT_USE_COLORS", raising=False)
+    monkeypatch.setenv("OT_INBOX_PATH", str(tmp_path))
+
+    (tmp_path / "Inbox.md").write_text("- [ ] from inbox\n", encoding="utf-8")
+
+    rc = _run_cli(monkeypatch, ["inbox"])
+    assert rc == 0
+    assert capsys.readouterr().out == "[ ] from inbox\n"
+
+
+def test_build_parser_only_builds_requested_subcommand(monkeypatch) -> None:
+    monkeypatch.setenv("OT_DISABLE_DOTENV", "1")
+
+    def subcommands(parser) -> set[str]:
+        sub = next(a for a in parser._actions if a.dest == "command")
+        return set(sub.choices)
+
+    assert subcommands(build_parser("today")) == {"today"}
+    full = subcommands(build_parser("nope"))
+    assert {"inbox", "today", "all", "overdue", "note", "add"} <= full
+
+
+def test_fast_parse_args_matches_argparse(monkeypatch) -> None:
+    monkeypatch.setenv("OT_DISABLE_DOTENV", "1")
+
+    for argv in (
+        ["today"],
+        ["yesterday", "--json"],
+        ["tomorrow", "-c", "--show-date"],
+        ["overdue", "--priority-only", "--color"],
+        ["all", "--unscheduled", "--json"],
+    ):
+        fast = _fast_parse_args(argv)
+        assert fast is not None
+        assert vars(fast) == vars(build_parser(argv[0]).parse_args(argv))
+
+    # Anything with values, positionals or help goes through argparse.
+    assert _fast_parse_args(["today", "--status", "open"]) is None
+    assert _fast_parse_args(["all", "--path", "a.md"]) is None
+    assert _fast_parse_args(["today", "--help"]) is None
+    assert _fast_parse_args(["note", "X"]) is None
+    assert _fast_parse_args([]) is None
+
+
+def test_build_parser_does_not_need_vault_path(monkeypatch) -> None:
+    monkeypatch.setenv("OT_DISABLE_DOTENV", "1")
+    for name in ("OT_VAULT_PATH", "OT_INBOX_NOTE", "OT_INBOX_PATH"):
+        monkeypatch.delenv(name, raising=False)
+
+    # The inbox path is resolved in _cmd_inbox, not as an argparse default.
+    assert build_parser().parse_args(["inbox"]).path is None
+
+
+def test_extract_tasks_from_file_cache_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(tasks_mod, "_FILE_TASKS_CACHE_MAX", 8)
+    for i in range(20):
+        f = tmp_path / f"n{i}.md"
+        f.write_text(f"- [ ] t{i}\n", encoding="utf-8")
+        assert [t.text for t in extract_tasks_from_file(f)] == [f"- [ ] t{i}"]
+
+    assert len(tasks_mod._FILE_TASKS_CACHE) <= 8
+    assert str(tmp_path / "n19.md") in tasks_mod._FILE_TASKS_CACHE
+
+
+def test_load_dotenv_if_present_parses_simple_lines(tmp_path: Path, monkeypatch) -> None:
+    env = tmp_path / ".env"
+    env.write_text(
+        "# OT_A=comment\n"
+        "  # OT_X=commented\n"
+        "\t#OT_Y=c2\n"
+        "\n"
+        "  OT_A = 'one'  \r\n"
+        'OT_B="two=2"\n'
+        "=orphan\n"
+        "no equals here\n"
+        "OT_C=\n"
+        "OT_D=four\rOT_E=five\r",
+        encoding="utf-8",
+    )
+    for name in ("OT_A", "OT_B", "OT_C", "OT_D", "OT_E"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OT_C", "kept")
+
+    load_dotenv_if_present(env)
+
+    assert os.environ["OT_A"] == "one"
+    assert os.environ["OT_B"] == "two=2"
+    assert os.environ["OT_C"] == "kept"
+    assert os.environ["OT_D"] == "four"
+    assert os.environ["OT_E"] == "five"
+    assert not [k for k in os.environ if "#" in k]
+
+
+def test_load_dotenv_if_present_rereads_edited_file(tmp_path: Path, monkeypatch) -> None:
+    env = tmp_path / ".env"
+    env.write_text("OT_A=one\n", encoding="utf-8")
+    monkeypatch.delenv("OT_A", raising=False)
+    load_dotenv_if_present(env)
+    assert os.environ["OT_A"] == "one"
+
+    env.write_text("OT_A=three\n", encoding="utf-8")
+    monkeypatch.delenv("OT_A")
+    load_dotenv_if_present(env)
+    assert os.environ["OT_A"] == "three"